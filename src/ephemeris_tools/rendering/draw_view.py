@@ -16,9 +16,11 @@ rspk_drawview.f exactly:
 
 from ephemeris_tools.rendering.draw_view_helpers import (
     FOV_PTS,
+    Projector,
     _rspk_write_label,
     camera_matrix,
     radec_to_plot,
+    radec_to_plot_many,
 )
 from ephemeris_tools.rendering.draw_view_impl import (
     DrawPlanetaryViewOptions,
@@ -28,8 +30,10 @@ from ephemeris_tools.rendering.draw_view_impl import (
 __all__ = [
     'FOV_PTS',
     'DrawPlanetaryViewOptions',
+    'Projector',
     '_rspk_write_label',
     'camera_matrix',
     'draw_planetary_view',
     'radec_to_plot',
+    'radec_to_plot_many',
 ]
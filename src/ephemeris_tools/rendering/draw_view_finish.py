@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from ephemeris_tools.rendering.draw_view_helpers import (
     _DEVICE,
     _STAR_FONTSIZE,
@@ -9,7 +11,7 @@ from ephemeris_tools.rendering.draw_view_helpers import (
     AXIS_LINE,
     FOV_PTS,
     STAR_LINE,
-    _radrec,
+    _radrec_many,
     _rspk_annotate,
     _rspk_labels2,
 )
@@ -19,7 +21,7 @@ from ephemeris_tools.rendering.euclid import (
     EuclidState,
     euclr,
     eustar,
-    eutemp,
+    eutemp_segment,
 )
 
 
@@ -33,7 +35,7 @@ def draw_view_box_labels_stars_close(
     moon_labelpts: float,
     body_names_list: list[str],
     body_los: list[list[float]],
-    body_pts: list[float],
+    body_pts: Sequence[float],
     use_diampts: float,
     fov: float,
     nbodies: int,
@@ -46,10 +48,10 @@ def draw_view_box_labels_stars_close(
 ) -> None:
     """Draw box borders, axis labels, moon labels, stars, then euclr (port of RSPK_DrawView)."""
     eswrit('%Draw box...', escher_state)
-    eutemp([-delta], [-delta], [-delta], [delta], 1, AXIS_LINE, view_state, escher_state)
-    eutemp([-delta], [delta], [delta], [delta], 1, AXIS_LINE, view_state, escher_state)
-    eutemp([delta], [delta], [delta], [-delta], 1, AXIS_LINE, view_state, escher_state)
-    eutemp([delta], [-delta], [-delta], [-delta], 1, AXIS_LINE, view_state, escher_state)
+    eutemp_segment(-delta, -delta, -delta, delta, AXIS_LINE, view_state, escher_state)
+    eutemp_segment(-delta, delta, delta, delta, AXIS_LINE, view_state, escher_state)
+    eutemp_segment(delta, delta, delta, -delta, AXIS_LINE, view_state, escher_state)
+    eutemp_segment(delta, -delta, -delta, -delta, AXIS_LINE, view_state, escher_state)
 
     _rspk_labels2(cmat, delta, AXIS_LINE, view_state, escher_state)
 
@@ -77,10 +79,18 @@ def draw_view_box_labels_stars_close(
         eswrit('%Draw stars...', escher_state)
         eslwid(_STAR_WIDTH, escher_state)
 
-    for i in range(nstars):
-        sra = star_ras[i] if i < len(star_ras) else 0.0
-        sdec = star_decs[i] if i < len(star_decs) else 0.0
-        los = list(_radrec(1.0, sra, sdec))
+    # Lines of sight for all stars at once (missing coordinates are 0.0);
+    # drawing order is unchanged.
+    ras = star_ras[:nstars]
+    decs = star_decs[:nstars]
+    star_los = _radrec_many(
+        ras + [0.0] * (nstars - len(ras)),
+        decs + [0.0] * (nstars - len(decs)),
+    )
+    # Stripped label per star; empty when unlabeled or labels are off.
+    labels = [name.strip() for name in star_names[:nstars]] if star_labels else []
+    labels += [''] * (nstars - len(labels))
+    for los, label in zip(star_los, labels, strict=True):
         eustar(
             (los[0], los[1], los[2]),
             1,
@@ -92,10 +102,9 @@ def draw_view_box_labels_stars_close(
             view_state,
             escher_state,
         )
-        sname = star_names[i] if i < len(star_names) else ''
-        if star_labels and sname.strip():
+        if label:
             _rspk_annotate(
-                sname.strip(),
+                label,
                 los,
                 0.0,
                 cmat,
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
 import math
 import struct
 import time as _time
-
-import cspyce
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
 from ephemeris_tools.rendering.escher import (
     EscherState,
@@ -18,10 +20,14 @@ from ephemeris_tools.rendering.escher import (
 from ephemeris_tools.rendering.euclid import (
     EuclidState,
     eubody,
+    eubody_visible,
     euring,
-    eutemp,
+    eutemp_segment,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # ---------------------------------------------------------------------------
 # Constants (from rspk_drawview.f)
 # ---------------------------------------------------------------------------
@@ -96,11 +102,78 @@ SUN_ID = 10
 HALFPI = math.pi / 2.0
 TWOPI = 2.0 * math.pi
 DPR = 180.0 / math.pi
+# Rotation by HALFPI, as evaluated by _vrotv_unit (cos(HALFPI) is not exactly 0).
+_COS_HALFPI = math.cos(HALFPI)
+_SIN_HALFPI = math.sin(HALFPI)
+# Seconds per radian for the tick scales: time seconds of RA, arcseconds of Dec.
+_SPR_RA = DPR * 3600.0 / 15.0
+_SPR_DEC = DPR * 3600.0
+
+# Fixed PostScript prolog: degree-capable font and the LabelBelow/LabelLeft macros.
+_PS_PROLOG_MACROS = (
+    '/MakeDegreeFont {\n'
+    'findfont dup /CharStrings get /degree known {\n'
+    'dup length dict /newdict exch def {\n'
+    '1 index /FID ne { newdict 3 1 roll put }\n'
+    '{ pop pop } ifelse } forall\n'
+    'newdict /Encoding get dup length array copy\n'
+    'newdict exch /Encoding exch put\n'
+    'newdict /CharStrings get /degree known {\n'
+    'newdict /Encoding get 8#260 /degree put } if\n'
+    'newdict true } { pop false } ifelse } def\n'
+    '/MyFont /Helvetica  MakeDegreeFont { definefont pop } if\n'
+    '/unscale {10 10 scale} def\n'
+    '/TextHeight {11} def\n'
+    '/MyFont findfont TextHeight scalefont setfont\n'
+    '/LabelBelow {gsave currentpoint translate\n'
+    'unscale\n'
+    'dup stringwidth pop -0.5 mul TextHeight -1.3 mul\n'
+    'moveto show grestore} def\n'
+    '/LabelLeft {gsave currentpoint translate\n'
+    'unscale 90 rotate\n'
+    'dup stringwidth pop -0.5 mul TextHeight 0.3 mul\n'
+    'moveto show grestore} def\n'
+)
+
+# LabelBody macro and end of prolog; {scale} is the moon label font scale.
+_PS_LABEL_BODY_TEMPLATE = (
+    '/LabelBody {{gsave currentpoint translate\n'
+    'unscale\n'
+    '{scale} {scale} scale\n'
+    'TextHeight 0.2 mul dup\n'
+    'moveto show grestore}} def\n'
+    '%%EndProlog\n'
+    '%\n'
+)
+
+# Credit footer; {planet_name} and {date_str} must already be PostScript-escaped.
+_PS_CREDIT_TEMPLATE = (
+    f'gsave unscale {int(_PS_POINTS_PER_INCH)} 36 translate 0.5 0.5 scale\n'
+    '0 0 moveto\n'
+    '(Generated by the {planet_name} Viewer Tool, '
+    'PDS Ring-Moon Systems Node, {date_str})\n'
+    'show grestore\n'
+)
+
+_PS_AXIS_LABELS = (
+    'gsave unscale\n'
+    '324 180 translate 1.2 1.2 scale\n'
+    '(Right Ascension (h m s)) dup stringwidth pop\n'
+    '-0.5 mul 0 moveto show grestore\n'
+    'gsave unscale\n'
+    '36 450 translate 1.2 1.2 scale 90 rotate\n'
+    '(Declination (d m s)) dup stringwidth pop\n'
+    '-0.5 mul TextHeight neg moveto show grestore\n'
+)
 
 
 def _fortran_nint(value: float) -> int:
-    """Return FORTRAN-compatible nearest integer (ties away from zero)."""
-    return int(value + 0.5) if value >= 0.0 else int(value - 0.5)
+    """Return FORTRAN-compatible nearest integer (ties away from zero).
+
+    Adds 0.5 with the sign of value and truncates: the same sums as the
+    branching form, int(value + 0.5) or int(value - 0.5), without the branch.
+    """
+    return int(value + math.copysign(0.5, value))
 
 
 def _fortran_data_real(value: float) -> float:
@@ -108,27 +181,91 @@ def _fortran_data_real(value: float) -> float:
     return float(struct.unpack('!f', struct.pack('!f', value))[0])
 
 
-def _recrad(v: tuple[float, float, float]) -> tuple[float, float, float]:
-    """Rectangular to spherical: (r, ra, dec)."""
+# _STEP1 as FORTRAN sees it (REAL DATA literals), rounded once at import.
+_STEP1_F32 = tuple(_fortran_data_real(step) for step in _STEP1)
+# Smallest axis span (2 * sdelta) that fits _MINSTEPS major ticks of each step; ascending.
+_STEP1_MIN_SPAN = tuple(_MINSTEPS * step for step in _STEP1_F32)
+# (minor tick spacing, minor ticks per major tick) for each step choice, indexed
+# by _tick_choice; index 0 is never selected.
+_TICK_STEPS = (
+    (0.0, 0),
+    *((_STEP1_F32[i] / _SUBSTEPS[i], _SUBSTEPS[i]) for i in range(1, _NCHOICES + 1)),
+)
+
+
+def _tick_choice(sdelta: float) -> int:
+    """Return the _STEP1 index for an axis half-width (port of the RSPK_Labels2 scan).
+
+    FORTRAN scans down from _NCHOICES for the largest step with at least
+    _MINSTEPS ticks across the axis, falling back to index 1. The thresholds
+    are ascending, so a bisection finds the same index.
+    """
+    return max(bisect.bisect_right(_STEP1_MIN_SPAN, 2.0 * sdelta, hi=_NCHOICES + 1) - 1, 1)
+
+
+def _recrad(v: Sequence[float]) -> tuple[float, float, float]:
+    """Rectangular to (range, ra, dec), ra in [0, 2*pi) (port of SPICE RECRAD).
+
+    Follows RECLAT's scaling by the largest component, so the result is
+    identical to cspyce.recrad without crossing into the SPICE library.
+    """
     x, y, z = v
-    r = math.sqrt(x * x + y * y + z * z)
-    if r < 1e-15:
+    vmax = max(abs(x), abs(y), abs(z))
+    if vmax <= 0.0:
         return (0.0, 0.0, 0.0)
-    lon = math.atan2(y, x)
-    lat = math.asin(max(-1.0, min(1.0, z / r)))
-    return (r, lon, lat)
+    x1 = x / vmax
+    y1 = y / vmax
+    z1 = z / vmax
+    rng = vmax * math.sqrt(x1 * x1 + y1 * y1 + z1 * z1)
+    dec = math.atan2(z1, math.sqrt(x1 * x1 + y1 * y1))
+    ra = 0.0 if x1 == 0.0 and y1 == 0.0 else math.atan2(y1, x1)
+    if ra < 0.0:
+        ra += TWOPI
+    return (rng, ra, dec)
+
+
+def _sincos(x: float) -> tuple[float, float]:
+    """Return (sin(x), cos(x))."""
+    return math.sin(x), math.cos(x)
 
 
 def _radrec(r: float, lon_rad: float, lat_rad: float) -> tuple[float, float, float]:
     """Spherical to rectangular."""
-    cos_lat = math.cos(lat_rad)
+    sin_lon, cos_lon = _sincos(lon_rad)
+    sin_lat, cos_lat = _sincos(lat_rad)
     return (
-        r * cos_lat * math.cos(lon_rad),
-        r * cos_lat * math.sin(lon_rad),
-        r * math.sin(lat_rad),
+        r * cos_lat * cos_lon,
+        r * cos_lat * sin_lon,
+        r * sin_lat,
     )
 
 
+def _radrec_many(lons_rad: Sequence[float], lats_rad: Sequence[float]) -> list[list[float]]:
+    """Unit vectors for many (lon, lat) pairs; same values as _radrec(1.0, lon, lat).
+
+    Parameters:
+        lons_rad: Longitudes (e.g. RA) in radians.
+        lats_rad: Latitudes (e.g. Dec) in radians, same length as lons_rad.
+
+    Returns:
+        One [x, y, z] list per input pair.
+    """
+    import numpy as np
+
+    lons = np.asarray(lons_rad, dtype=np.float64)
+    lats = np.asarray(lats_rad, dtype=np.float64)
+    cos_lat = np.cos(lats)
+    rows: list[list[float]] = np.stack(
+        (cos_lat * np.cos(lons), cos_lat * np.sin(lons), np.sin(lats)), axis=1
+    ).tolist()
+    return rows
+
+
+# Characters that need escaping inside a PostScript string, and their escapes.
+_PS_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '(': '\\(', ')': '\\)', '\u00b0': '\\260'})
+
+
+@functools.lru_cache(maxsize=4096)
 def _rspk_escape(s: str) -> str:
     """Escape a string for PostScript: backslashes, parentheses, and degree symbol.
 
@@ -136,15 +273,10 @@ def _rspk_escape(s: str) -> str:
     PostScript interprets as two bytes; the first (0xC2) can render as a prime
     (U+2032) with common fonts. Replacing it with the PostScript escape \\260
     yields a single byte 0xB0 so only the degree glyph is shown.
-    """
-    return (
-        s.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)').replace('\u00b0', '\\260')
-    )
-
 
-def _rspk_write_string(s: str, state: EscherState) -> None:
-    """Write a PostScript-format string with escaped backslashes and parentheses."""
-    eswrit(f'({_rspk_escape(s)})', state)
+    Memoized: tick labels, moon names, and captions repeat across views.
+    """
+    return s.translate(_PS_ESCAPE_TABLE)
 
 
 def _rspk_write_label(
@@ -170,124 +302,162 @@ def _rspk_write_label(
     isec = isec - 60 * imin
     ideg = imin // 60
     imin = imin - 60 * ideg
-    s = f'{ideg:3d} {imin:02d} {isec:02d}.{ims:03d}'
-    if (offset == 'B' and ims == 0) or (offset == 'L' and ims == 0):
-        s = f'{ideg:3d} {imin:02d} {isec:02d}'
-    else:
-        s = s.rstrip('0 ').rstrip('.')
-    s = s.lstrip()
+    # Whole seconds print as "d mm ss"; otherwise append the milliseconds with
+    # trailing zeros removed ("d mm ss.f", "d mm ss.ff", or "d mm ss.fff").
+    s = f'{ideg} {imin:02d} {isec:02d}'
+    if ims != 0:
+        s += f'.{ims:03d}'.rstrip('0')
     if fsign < 0:
         s = '-' + s
     esmove(escher_state)
-    safe = _rspk_escape(s)
-    if offset == 'L':
-        eswrit(f'({safe}) LabelLeft', escher_state)
-    else:
-        eswrit(f'({safe}) LabelBelow', escher_state)
+    # The label holds only digits, spaces, '.', and '-', none of which need
+    # PostScript escaping, so it is written without _rspk_escape.
+    macro = 'LabelLeft' if offset == 'L' else 'LabelBelow'
+    eswrit(f'({s}) {macro}', escher_state)
 
 
 def _rspk_annotate(
     name: str,
-    los: list[float],
+    los: Sequence[float],
     radius: float,
-    cmatrix: list[list[float]],
+    cmatrix: Sequence[Sequence[float]],
     delta: float,
     view_state: EscherViewState,
     escher_state: EscherState,
 ) -> None:
     """Write body name at position (port of RSPK_Annotate)."""
-    cam = list(cspyce.mtxv(cmatrix, los))
-    if cam[2] <= 0.0:
+    # MTXV(cmatrix, los) on unpacked elements (same operation order as SPICE),
+    # one component at a time so that bodies behind the camera or off either
+    # side of the field return before the remaining components are computed.
+    (c00, c01, c02), (c10, c11, c12), (c20, c21, c22) = cmatrix
+    lx, ly, lz = los
+    cam_z = c02 * lx + c12 * ly + c22 * lz
+    if cam_z <= 0.0:
         return
-    x = -cam[0] / cam[2]
-    y = -cam[1] / cam[2]
-    x = x + 0.7070 * radius
-    y = y - 0.7070 * radius
-    if abs(x) < delta and abs(y) < delta:
-        eutemp([x], [y], [x], [y], 1, 1, view_state, escher_state)
+    x = -(c00 * lx + c10 * ly + c20 * lz) / cam_z + 0.7070 * radius
+    if abs(x) >= delta:
+        return
+    y = -(c01 * lx + c11 * ly + c21 * lz) / cam_z - 0.7070 * radius
+    if abs(y) < delta:
+        eutemp_segment(x, y, x, y, 1, view_state, escher_state)
         esmove(escher_state)
         name_safe = _rspk_escape(name)
         eswrit(f'({name_safe}) LabelBody', escher_state)
 
 
+def _visible_ticks(
+    cam_u: np.ndarray, cam_z: np.ndarray, delta: float
+) -> tuple[list[int], list[float]]:
+    """Return indices and plot offsets of the ticks that land inside the FOV.
+
+    Parameters:
+        cam_u: Camera-frame x (or y) components of the tick lines of sight.
+        cam_z: Camera-frame z components of the tick lines of sight.
+        delta: Half-width of the field of view in plot units.
+
+    Returns:
+        Tuple (indices, offsets) of the ticks in front of the camera with
+        |-cam_u / cam_z| <= delta, as Python ints and floats.
+    """
+    import numpy as np
+
+    front = cam_z > 1e-12
+    offsets = np.zeros_like(cam_u)
+    np.divide(-cam_u, cam_z, out=offsets, where=front)
+    idx = np.flatnonzero(front & (np.abs(offsets) <= delta))
+    return idx.tolist(), offsets[idx].tolist()
+
+
 def _rspk_labels2(
-    cmatrix: list[list[float]],
+    cmatrix: Sequence[Sequence[float]],
     delta: float,
     ltype: int,
     view_state: EscherViewState,
     escher_state: EscherState,
 ) -> None:
-    """Plot RA/Dec tick marks and numeric labels on the figure (port of RSPK_Labels2)."""
-    dpr = DPR
-    _rng, ra, dec = cspyce.recrad((cmatrix[0][2], cmatrix[1][2], cmatrix[2][2]))
-    delta_ra = delta / math.cos(dec) if abs(math.cos(dec)) > 1e-12 else delta
+    """Plot RA/Dec tick marks and numeric labels on the figure (port of RSPK_Labels2).
+
+    Tick positions, visibility, and the major/minor decision along each axis
+    are computed in one NumPy batch; the Python loop only draws and labels
+    the visible ticks.
+    """
+    import numpy as np
+
+    (c00, c01, c02), (c10, c11, c12), (c20, c21, c22) = cmatrix
+    _rng, ra, dec = _recrad((c02, c12, c22))
+    cos_dec = math.cos(dec)
+    delta_ra = delta / cos_dec if abs(cos_dec) > 1e-12 else delta
     dtick1 = _TICKSIZE1 * delta
     dtick2 = _TICKSIZE2 * delta
-    spr = dpr * 3600.0 / 15.0
+    spr = _SPR_RA
     sdelta = delta_ra * spr
-    i = _NCHOICES
-    while i >= 2:
-        if 2.0 * sdelta >= _MINSTEPS * _fortran_data_real(_STEP1[i]):
-            break
-        i -= 1
-    nsubs = _SUBSTEPS[i]
-    ds = _fortran_data_real(_STEP1[i]) / nsubs
+    ds, nsubs = _TICK_STEPS[_tick_choice(sdelta)]
     ra_sec = ra * spr
     k1 = _fortran_nint((ra_sec - sdelta) / ds + 0.5)
     k2 = _fortran_nint((ra_sec + sdelta) / ds - 0.5)
-    _eps = 1e-12
-    for k in range(k1, k2 + 1):
+    # All RA ticks at once: line of sight at (s / spr, dec), rotated into the camera
+    # frame with the same operation order as SPICE RADREC and MTXV.
+    # Temporaries are updated in place (same operations, same order) so each
+    # pass allocates only a handful of tick-length arrays.
+    ks = np.arange(k1, k2 + 1)
+    ra_arr = ks * ds
+    ra_arr /= spr
+    los_x = np.cos(ra_arr)
+    los_x *= cos_dec
+    los_y = np.sin(ra_arr, out=ra_arr)
+    los_y *= cos_dec
+    los_z = math.sin(dec)
+    cam_x = c00 * los_x
+    cam_x += c10 * los_y
+    cam_x += c20 * los_z
+    cam_z = c02 * los_x
+    cam_z += c12 * los_y
+    cam_z += c22 * los_z
+    vis, offsets = _visible_ticks(cam_x, cam_z, delta)
+    ks_vis = ks[vis]
+    for k, x, ismajor in zip(ks_vis.tolist(), offsets, (ks_vis % nsubs == 0).tolist(), strict=True):
         s = k * ds
-        length = dtick2
-        ismajor = (k % nsubs) == 0
+        length = dtick1 if ismajor else dtick2
+        eutemp_segment(x, delta - length, x, delta, ltype, view_state, escher_state)
         if ismajor:
-            length = dtick1
-        j2000_los = cspyce.radrec(1.0, s / spr, dec)
-        cam = list(cspyce.mtxv(cmatrix, j2000_los))
-        if cam[2] <= _eps or abs(cam[2]) < _eps:
-            continue
-        x = -cam[0] / cam[2]
-        if abs(x) <= delta:
-            eutemp([x], [delta - length], [x], [delta], 1, ltype, view_state, escher_state)
-            if ismajor:
-                _rspk_write_label(s, 'B', escher_state)
-            eutemp([x], [-delta + length], [x], [-delta], 1, ltype, view_state, escher_state)
-    spr = dpr * 3600.0
+            _rspk_write_label(s, 'B', escher_state)
+        eutemp_segment(x, -delta + length, x, -delta, ltype, view_state, escher_state)
+    spr = _SPR_DEC
     sdelta = delta * spr
-    i = _NCHOICES
-    while i >= 2:
-        if 2.0 * sdelta >= _MINSTEPS * _fortran_data_real(_STEP1[i]):
-            break
-        i -= 1
-    nsubs = _SUBSTEPS[i]
-    ds = _fortran_data_real(_STEP1[i]) / nsubs
+    ds, nsubs = _TICK_STEPS[_tick_choice(sdelta)]
     dec_sec = dec * spr
     k1 = _fortran_nint((dec_sec - sdelta) / ds + 0.5)
     k2 = _fortran_nint((dec_sec + sdelta) / ds - 0.5)
-    for k in range(k1, k2 + 1):
+    ks = np.arange(k1, k2 + 1)
+    dec_arr = ks * ds
+    dec_arr /= spr
+    cos_dec_arr = np.cos(dec_arr)
+    los_x = math.cos(ra) * cos_dec_arr
+    los_y = np.multiply(math.sin(ra), cos_dec_arr, out=cos_dec_arr)
+    los_z = np.sin(dec_arr, out=dec_arr)
+    cam_y = c01 * los_x
+    cam_y += c11 * los_y
+    cam_y += c21 * los_z
+    cam_z = c02 * los_x
+    cam_z += c12 * los_y
+    cam_z += c22 * los_z
+    vis, offsets = _visible_ticks(cam_y, cam_z, delta)
+    ks_vis = ks[vis]
+    for k, y, ismajor in zip(ks_vis.tolist(), offsets, (ks_vis % nsubs == 0).tolist(), strict=True):
         s = k * ds
-        length = dtick2
-        ismajor = (k % nsubs) == 0
+        length = dtick1 if ismajor else dtick2
+        eutemp_segment(-delta + length, y, -delta, y, ltype, view_state, escher_state)
         if ismajor:
-            length = dtick1
-        j2000_los = cspyce.radrec(1.0, ra, s / spr)
-        cam = list(cspyce.mtxv(cmatrix, j2000_los))
-        if cam[2] <= _eps or abs(cam[2]) < _eps:
-            continue
-        y = -cam[1] / cam[2]
-        if abs(y) <= delta:
-            eutemp([-delta + length], [y], [-delta], [y], 1, ltype, view_state, escher_state)
-            if ismajor:
-                _rspk_write_label(s, 'L', escher_state)
-            eutemp([delta - length], [y], [delta], [y], 1, ltype, view_state, escher_state)
+            _rspk_write_label(s, 'L', escher_state)
+        eutemp_segment(delta - length, y, delta, y, ltype, view_state, escher_state)
 
 
 def _rspk_draw_bodies(
     *,
     nbodies: int,
-    body_pts: list[float],
+    body_pts: Sequence[float],
     body_names: list[str],
-    body_dist: list[float],
+    body_dist: Sequence[float],
     body_diampts: float,
     update_names: bool,
     mindist: float,
@@ -318,23 +488,39 @@ def _rspk_draw_bodies(
     eslwid(0.0, escher_state)
     eubody(1, pmerids, plats, 1, l1, l2, l3, euclid_state, view_state, escher_state)
     eubody(2, 2, 1, 1, 0, 0, 0, euclid_state, view_state, escher_state)
+    # Line styles and visibility for interior/exterior moons, and whether moon
+    # prime meridians can be drawn at all, do not change from moon to moon.
+    outer_lines = (l1, l2, l3)
+    inner_lines = (lit_line2, dark_line2, term_line2)
+    outer_vis = isvis
+    inner_vis = lit_line2 != 0 or dark_line2 != 0 or term_line2 != 0
+    moon_primes = prime_pts > 0.0 and body_diampts == 0.0
+    ndist = len(body_dist)
+    nnames = len(body_names)
+    npts = len(body_pts)
     for ibody in range(3, nbodies + 1):
         bi = ibody - 1
-        inner = (body_dist[bi] < mindist) if bi < len(body_dist) else False
-        bl1, bl2, bl3 = (lit_line2, dark_line2, term_line2) if inner else (l1, l2, l3)
-        bvis = bl1 != 0 or bl2 != 0 or bl3 != 0
-        bname = body_names[bi] if bi < len(body_names) else ''
-        if bvis and bname.strip():
-            eswrit(f'%Draw {bname.strip()}...', escher_state)
-        bpts = body_pts[bi] if bi < len(body_pts) else 0.0
-        if bvis and prime_pts > 0.0 and body_diampts == 0.0 and bpts > body_diampts * 8.0:
+        inner = body_dist[bi] < mindist if bi < ndist else False
+        bl1, bl2, bl3 = inner_lines if inner else outer_lines
+        bvis = inner_vis if inner else outer_vis
+        bname = body_names[bi].strip() if bi < nnames else ''
+        if bvis and bname:
+            eswrit(f'%Draw {bname}...', escher_state)
+        bpts = body_pts[bi] if bi < npts else 0.0
+        # Moons entirely outside the FOV draw nothing; test once and skip the
+        # EUBODY calls. Comments and line widths are still written so the
+        # PostScript stays identical to FORTRAN.
+        inview = eubody_visible(ibody, euclid_state)
+        if bvis and moon_primes and bpts > 0.0:
             eslwid(prime_pts, escher_state)
-            eubody(ibody, 1, 0, 1, bl1, bl2, 0, euclid_state, view_state, escher_state)
-            eubody(ibody, 0, 0, 1, 0, 0, 0, euclid_state, view_state, escher_state)
+            if inview:
+                eubody(ibody, 1, 0, 1, bl1, bl2, 0, euclid_state, view_state, escher_state)
+                eubody(ibody, 0, 0, 1, 0, 0, 0, euclid_state, view_state, escher_state)
         escher_state.drawn = False
         eslwid(body_diampts - bpts, escher_state)
-        eubody(ibody, mmerids, mlats, 1, bl1, bl2, bl3, euclid_state, view_state, escher_state)
-        if update_names and bvis and not escher_state.drawn and bi < len(body_names):
+        if inview:
+            eubody(ibody, mmerids, mlats, 1, bl1, bl2, bl3, euclid_state, view_state, escher_state)
+        if update_names and bvis and not escher_state.drawn and bi < nnames:
             body_names[bi] = ' '
     eslwid(0.0, escher_state)
 
@@ -353,7 +539,7 @@ def _rspk_draw_rings(
     loop_locs: list[list[float]],
     loop_axes1: list[list[float]],
     loop_axes2: list[list[float]],
-    loop_ring: list[int],
+    loop_ring: Sequence[int],
     arc_width: float,
     lit_line: int,
     dark_line: int,
@@ -363,14 +549,20 @@ def _rspk_draw_rings(
     view_state: EscherViewState,
     escher_state: EscherState,
 ) -> None:
-    """Draw all rings and arc segments (port of RSPK_DrawRings)."""
-    for iring in range(iring1, iring2 + 1):
-        ri = iring - 1
-        if ri < 0 or ri >= len(ring_flags) or not ring_flags[ri]:
+    """Draw all rings and arc segments (port of RSPK_DrawRings).
+
+    Ring order and the per-ring setdash toggles are kept exactly as in FORTRAN
+    (the output must match byte-for-byte); only loop-invariant lookups are
+    hoisted out of the ring and arc loops.
+    """
+    # Only rings that exist in ring_flags can be drawn; clamp the range once.
+    for ri in range(max(iring1, 1) - 1, min(iring2, len(ring_flags))):
+        if not ring_flags[ri]:
             continue
         draw_line = dark_line if ring_dark[ri] else lit_line
-        eswrit(f'%Draw ring #{iring:2d}...', escher_state)
-        if ring_dashed[ri]:
+        dashed = ring_dashed[ri]
+        eswrit(f'%Draw ring #{ri + 1:2d}...', escher_state)
+        if dashed:
             eswrit('[30 30] 0 setdash', escher_state)
         euring(
             ring_locs[ri],
@@ -383,42 +575,189 @@ def _rspk_draw_rings(
             view_state,
             escher_state,
         )
-        if ring_dashed[ri]:
+        if dashed:
             eswrit('[] 0 setdash', escher_state)
     if nloops > 0:
         eswrit('%Draw arcs...', escher_state)
     eslwid(arc_width, escher_state)
+    ndark = len(ring_dark)
     for iloop in range(nloops):
         iring = loop_ring[iloop]
-        if iring1 <= iring <= iring2:
-            ri = iring - 1
-            draw_line = dark_line if (0 <= ri < len(ring_dark) and ring_dark[ri]) else lit_line
-            euring(
-                loop_locs[iloop],
-                loop_axes1[iloop],
-                loop_axes2[iloop],
-                1,
-                draw_line,
-                shadow_line,
-                euclid_state,
-                view_state,
-                escher_state,
-            )
+        if not iring1 <= iring <= iring2:
+            continue
+        ri = iring - 1
+        draw_line = dark_line if (0 <= ri < ndark and ring_dark[ri]) else lit_line
+        euring(
+            loop_locs[iloop],
+            loop_axes1[iloop],
+            loop_axes2[iloop],
+            1,
+            draw_line,
+            shadow_line,
+            euclid_state,
+            view_state,
+            escher_state,
+        )
     eslwid(0.0, escher_state)
 
 
+def _spice_vnorm(x: float, y: float, z: float) -> float:
+    """Vector magnitude, scaled by the largest component exactly as SPICE VNORM does."""
+    vmax = max(abs(x), abs(y), abs(z))
+    if vmax == 0.0:
+        return 0.0
+    tx, ty, tz = x / vmax, y / vmax, z / vmax
+    return vmax * math.sqrt(tx * tx + ty * ty + tz * tz)
+
+
 def camera_matrix(center_ra_rad: float, center_dec_rad: float) -> list[list[float]]:
-    """Camera orientation matrix for center (ra, dec) in J2000 (port of RSPK_DrawView)."""
-    col3 = list(cspyce.radrec(1.0, center_ra_rad, center_dec_rad))
-    temp = list(cspyce.vperp((0.0, 0.0, 1.0), col3))
-    n2 = math.sqrt(temp[0] * temp[0] + temp[1] * temp[1] + temp[2] * temp[2])
-    col2 = list(cspyce.vhat(temp)) if n2 >= 1e-12 else [1.0, 0.0, 0.0]
-    col1 = list(cspyce.vcrss(col2, col3))
-    return [
-        [col1[0], col2[0], col3[0]],
-        [col1[1], col2[1], col3[1]],
-        [col1[2], col2[2], col3[2]],
-    ]
+    """Camera orientation matrix for center (ra, dec) in J2000 (port of RSPK_DrawView).
+
+    Returns a fresh list-of-lists copy of the memoized _camera_matrix_rows.
+    """
+    return [list(row) for row in _camera_matrix_rows(center_ra_rad, center_dec_rad)]
+
+
+@functools.lru_cache(maxsize=32)
+def _camera_matrix_rows(
+    center_ra_rad: float, center_dec_rad: float
+) -> tuple[tuple[float, float, float], ...]:
+    """Immutable, memoized camera matrix rows for center (ra, dec).
+
+    Column 3 is the optic axis (RADREC), column 2 is J2000 north made
+    perpendicular to it (VPERP + VHAT), and column 1 is their cross product
+    (VCRSS). The SPICE routines are evaluated inline with their operation
+    order, so the result is identical to calling them through cspyce.
+    """
+    cos_dec = math.cos(center_dec_rad)
+    col3 = (
+        math.cos(center_ra_rad) * cos_dec,
+        math.sin(center_ra_rad) * cos_dec,
+        math.sin(center_dec_rad),
+    )
+    # VPERP((0, 0, 1), col3) -> VPROJ; both scale inputs by the reciprocal of
+    # their largest component, which is a no-op for (0, 0, 1).
+    inv = 1.0 / max(abs(col3[0]), abs(col3[1]), abs(col3[2]))
+    rx, ry, rz = col3[0] * inv, col3[1] * inv, col3[2] * inv
+    inv = 1.0 / max(abs(rx), abs(ry), abs(rz))
+    rx, ry, rz = rx * inv, ry * inv, rz * inv
+    proj = (0.0 * rx + 0.0 * ry + rz) / (rx * rx + ry * ry + rz * rz)
+    tx, ty, tz = 0.0 - proj * rx, 0.0 - proj * ry, 1.0 - proj * rz
+    n2 = math.sqrt(tx * tx + ty * ty + tz * tz)
+    if n2 >= 1e-12:
+        tmag = _spice_vnorm(tx, ty, tz)
+        col2 = (tx / tmag, ty / tmag, tz / tmag)
+    else:
+        col2 = (1.0, 0.0, 0.0)
+    col1 = (
+        col2[1] * col3[2] - col2[2] * col3[1],
+        col2[2] * col3[0] - col2[0] * col3[2],
+        col2[0] * col3[1] - col2[1] * col3[0],
+    )
+    return (
+        (col1[0], col2[0], col3[0]),
+        (col1[1], col2[1], col3[1]),
+        (col1[2], col2[2], col3[2]),
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _fov_scale(fov_rad: float) -> float:
+    """Return plot points per unit tangent-plane distance for a field of view.
+
+    Raises:
+        ValueError: If fov_rad is not in (0, pi), where tan(fov/2) is undefined
+            or non-positive.
+    """
+    if fov_rad <= 0:
+        raise ValueError('fov_rad must be positive')
+    if fov_rad >= math.pi:
+        raise ValueError(f'fov_rad must be less than pi, got {fov_rad!r}')
+    return FOV_PTS / (2.0 * math.tan(fov_rad / 2.0))
+
+
+class Projector:
+    """Camera projection from (ra, dec) to plot points for one figure.
+
+    Holds the camera matrix columns and the plot scale for a fixed center and
+    field of view, so callers that project many points (bodies, ticks, captions)
+    build them once instead of on every call.
+    """
+
+    def __init__(
+        self,
+        center_ra_rad: float,
+        center_dec_rad: float,
+        fov_rad: float,
+        cmat: Sequence[Sequence[float]] | None = None,
+    ) -> None:
+        """Build the projection for a field of view centered at (ra, dec).
+
+        Parameters:
+            center_ra_rad: Right ascension of the field center in radians.
+            center_dec_rad: Declination of the field center in radians.
+            fov_rad: Full field of view in radians, in (0, pi).
+            cmat: Optional precomputed camera matrix from camera_matrix().
+
+        Raises:
+            ValueError: If fov_rad is not in (0, pi).
+        """
+        self.scale = _fov_scale(fov_rad)
+        if cmat is None:
+            cmat = _camera_matrix_rows(center_ra_rad, center_dec_rad)
+        self.cmat = cmat
+        self.col1 = (cmat[0][0], cmat[1][0], cmat[2][0])
+        self.col2 = (cmat[0][1], cmat[1][1], cmat[2][1])
+        self.col3 = (cmat[0][2], cmat[1][2], cmat[2][2])
+
+    def project(self, ra_rad: float, dec_rad: float) -> tuple[float, float] | None:
+        """Return plot coordinates (x, y) in points, or None if behind the camera."""
+        x, y, z = _radrec(1.0, ra_rad, dec_rad)
+        c1, c2, c3 = self.col1, self.col2, self.col3
+        cam_z = c3[0] * x + c3[1] * y + c3[2] * z
+        if cam_z <= 0.0:
+            return None
+        cam_x = c1[0] * x + c1[1] * y + c1[2] * z
+        cam_y = c2[0] * x + c2[1] * y + c2[2] * z
+        return (-self.scale * cam_x / cam_z, -self.scale * cam_y / cam_z)
+
+    def project_arr(
+        self,
+        ras_rad: np.ndarray | list[float],
+        decs_rad: np.ndarray | list[float],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Project arrays of (ra, dec) to plot coordinates in one batched pass.
+
+        Each of cos/sin is evaluated once per input array and the camera
+        rotation is a single matrix product. Points behind the camera are
+        masked out before the perspective divide, so callers can drop them
+        before doing any formatting or drawing.
+
+        Parameters:
+            ras_rad: Right ascensions in radians.
+            decs_rad: Declinations in radians (same length as ras_rad).
+
+        Returns:
+            Tuple (x, y, visible): float arrays of plot coordinates in points
+            (NaN where not visible) and a boolean mask of points in front of
+            the camera.
+        """
+        import numpy as np
+
+        ras = np.asarray(ras_rad, dtype=np.float64)
+        decs = np.asarray(decs_rad, dtype=np.float64)
+        cos_dec = np.cos(decs)
+        los = np.stack((cos_dec * np.cos(ras), cos_dec * np.sin(ras), np.sin(decs)), axis=-1)
+        cam = los @ np.array(self.cmat, dtype=np.float64)
+        visible = cam[..., 2] > 0.0
+        x = np.full(visible.shape, np.nan)
+        y = np.full(visible.shape, np.nan)
+        # Gather the visible rows once; the divide and scaling run on that block.
+        front = cam[visible]
+        factor = -self.scale / front[:, 2]
+        x[visible] = front[:, 0] * factor
+        y[visible] = front[:, 1] * factor
+        return (x, y, visible)
 
 
 def radec_to_plot(
@@ -429,24 +768,45 @@ def radec_to_plot(
     fov_rad: float,
     cmat: list[list[float]] | None = None,
 ) -> tuple[float, float] | None:
-    """Convert (ra, dec) to plot coordinates (x, y) in points. Returns None if behind camera."""
-    if fov_rad <= 0:
-        raise ValueError('fov_rad must be positive')
-    if cmat is None:
-        cmat = camera_matrix(center_ra_rad, center_dec_rad)
-    los = list(cspyce.radrec(1.0, ra_rad, dec_rad))
-    cam = list(cspyce.mtxv(cmat, los))
-    if cam[2] <= 0.0:
-        return None
-    half = math.tan(fov_rad / 2.0)
-    x_plot = -FOV_PTS * cam[0] / (cam[2] * 2.0 * half)
-    y_plot = -FOV_PTS * cam[1] / (cam[2] * 2.0 * half)
-    return (x_plot, y_plot)
+    """Convert (ra, dec) to plot coordinates (x, y) in points. Returns None if behind camera.
+
+    For many points in the same figure, build a Projector once and call its
+    project() method instead.
+    """
+    return Projector(center_ra_rad, center_dec_rad, fov_rad, cmat).project(ra_rad, dec_rad)
+
+
+def radec_to_plot_many(
+    ras_rad: np.ndarray | list[float],
+    decs_rad: np.ndarray | list[float],
+    center_ra_rad: float,
+    center_dec_rad: float,
+    fov_rad: float,
+    cmat: list[list[float]] | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert arrays of (ra, dec) to plot coordinates with one camera matrix.
+
+    Batch counterpart of radec_to_plot; see Projector.project_arr for the
+    returned (x, y, visible) arrays.
+    """
+    return Projector(center_ra_rad, center_dec_rad, fov_rad, cmat).project_arr(ras_rad, decs_rad)
+
+
+# (whole second, formatted date) of the last footer date, reused within the same second.
+_generated_date_cache: tuple[int, str] = (-1, '')
 
 
 def _generated_date_str() -> str:
-    """Return current date for Generated-by footer (match FDATE format)."""
-    return _time.strftime('%a %b %d %H:%M:%S %Y', _time.localtime())
+    """Return current date for Generated-by footer (match FDATE format).
+
+    The formatted string has one-second resolution, so it is cached per second
+    for callers that render many pages in a batch.
+    """
+    global _generated_date_cache
+    now = int(_time.time())
+    if _generated_date_cache[0] != now:
+        _generated_date_cache = (now, _time.strftime('%a %b %d %H:%M:%S %Y', _time.localtime(now)))
+    return _generated_date_cache[1]
 
 
 def _vnorm(v: list[float]) -> float:
@@ -454,6 +814,11 @@ def _vnorm(v: list[float]) -> float:
     return math.sqrt(v[0] * v[0] + v[1] * v[1] + v[2] * v[2])
 
 
+def _norm3(x: float, y: float, z: float) -> float:
+    """Magnitude of (x, y, z); same value as _vnorm without building a list."""
+    return math.sqrt(x * x + y * y + z * z)
+
+
 def _vhat(v: list[float]) -> list[float]:
     """Unit vector."""
     n = _vnorm(v)
@@ -467,20 +832,242 @@ def _opsgnd(a: float, b: float) -> bool:
     return (a > 0 and b < 0) or (a < 0 and b > 0)
 
 
+def _unit_rows(v: np.ndarray, *, require_nonzero: bool = False) -> np.ndarray:
+    """Row-wise _vhat of an (N, 3) array; zero rows stay zero.
+
+    With require_nonzero, behaves like _rotation_axis instead and raises
+    ValueError if any row is zero.
+    """
+    import numpy as np
+
+    x, y, z = v[:, 0], v[:, 1], v[:, 2]
+    norms = np.sqrt(x * x + y * y + z * z)
+    zero = norms == 0.0
+    if require_nonzero and zero.any():
+        raise ValueError('axis must be non-zero')
+    out = np.zeros_like(v)
+    np.divide(v, norms[:, None], out=out, where=~zero[:, None])
+    return out
+
+
+def _vrotv_rows(v: np.ndarray, ax: np.ndarray, ca: np.ndarray, sa: np.ndarray) -> np.ndarray:
+    """Row-wise _vrotv_unit_cs: rotate v about unit ax given cos ca and sin sa.
+
+    v and ax are (N, 3) or (3,) arrays (broadcast against the (N,) ca/sa).
+    Each component is evaluated with the same operations, in the same order,
+    as the scalar version.
+    """
+    import numpy as np
+
+    vx, vy, vz = v[..., 0], v[..., 1], v[..., 2]
+    axx, axy, axz = ax[..., 0], ax[..., 1], ax[..., 2]
+    omc = 1.0 - ca
+    dot = vx * axx + vy * axy + vz * axz
+    return np.stack(
+        (
+            vx * ca + (axy * vz - axz * vy) * sa + axx * dot * omc,
+            vy * ca + (axz * vx - axx * vz) * sa + axy * dot * omc,
+            vz * ca + (axx * vy - axy * vx) * sa + axz * dot * omc,
+        ),
+        axis=-1,
+    )
+
+
+def _ring_shapes(
+    *,
+    pole: Sequence[float],
+    pole_axis: Sequence[float],
+    ascnode: Sequence[float],
+    planet_loc: Sequence[float],
+    obs_loc: Sequence[float],
+    offset: Sequence[float],
+    sun_hat: Sequence[float],
+    sun_angular: float,
+    nodes: Sequence[float],
+    incs: Sequence[float],
+    peris: Sequence[float],
+    rads: Sequence[float],
+    eccs: Sequence[float],
+    elevs: Sequence[float],
+    offsets: Sequence[Sequence[float]],
+    dashed: Sequence[bool],
+) -> tuple[list[list[float]], list[list[float]], list[list[float]], list[list[float]], list[bool]]:
+    """Ring centers, semi-axes, and dark flags for many rings in one batch.
+
+    Vectorized over rings, with the same per-component operations as the
+    scalar chain in RSPK_DrawView: the ring node is rotated about the planet
+    pole, the ring pole is tilted about the node by the inclination, the
+    pericenter is rotated about the ring pole, and the minor axis is the
+    pericenter turned by HALFPI.
+
+    Parameters:
+        pole: Planet pole unit vector (J2000).
+        pole_axis: _rotation_axis(pole).
+        ascnode: Ascending node of the planet equator on the J2000 equator.
+        planet_loc: Planet position.
+        obs_loc: Observer position.
+        offset: Planet light-time position offset.
+        sun_hat: Unit vector toward the Sun.
+        sun_angular: Angular radius of the Sun.
+        nodes, incs, peris: Ring node, inclination, and pericenter (radians).
+        rads, eccs, elevs: Ring semimajor axis, eccentricity, and elevation.
+        offsets: Ring center offsets, one [x, y, z] per ring.
+        dashed: Per-ring dashed flag (dashed rings are never dark).
+
+    Returns:
+        Tuple (locs, axes1, axes2, axes3, dark), one entry per ring.
+
+    Raises:
+        ValueError: If a ring node or pole is a zero vector.
+    """
+    import numpy as np
+
+    f64 = np.float64
+    nodes_a = np.asarray(nodes, dtype=f64)
+    incs_a = np.asarray(incs, dtype=f64)
+    rads_a = np.asarray(rads, dtype=f64)[:, None]
+    eccs_a = np.asarray(eccs, dtype=f64)
+    pole_a = np.asarray(pole, dtype=f64)
+
+    ringnode = _vrotv_rows(
+        np.asarray(ascnode, dtype=f64),
+        np.asarray(pole_axis, dtype=f64),
+        np.cos(nodes_a),
+        np.sin(nodes_a),
+    )
+    node_axis = _unit_rows(ringnode, require_nonzero=True)
+    ringpole = _unit_rows(_vrotv_rows(pole_a, node_axis, np.cos(incs_a), np.sin(incs_a)))
+    ringpole_axis = _unit_rows(ringpole, require_nonzero=True)
+    turn = np.asarray(peris, dtype=f64) - nodes_a
+    peri = _unit_rows(_vrotv_rows(ringnode, ringpole_axis, np.cos(turn), np.sin(turn)))
+    axes1 = rads_a * peri
+    minor_dir = _vrotv_rows(
+        peri, ringpole_axis, np.full_like(turn, _COS_HALFPI), np.full_like(turn, _SIN_HALFPI)
+    )
+    axes2 = (rads_a * np.sqrt(1.0 - eccs_a * eccs_a)[:, None]) * minor_dir
+    axes3 = RING_THICKNESS * ringpole
+    # Center = planet_loc - ecc * major_axis + elevation + offset, summed per
+    # component in that order.
+    locs = (
+        (-eccs_a)[:, None] * axes1
+        + np.asarray(planet_loc, dtype=f64)
+        + np.asarray(elevs, dtype=f64)[:, None] * pole_a
+        + np.asarray(offsets, dtype=f64).reshape(-1, 3)
+    )
+
+    # Dark when the observer and the Sun are on opposite sides of the ring
+    # plane (and the Sun is not partly in it); dashed rings are never dark.
+    tempvec = (locs - np.asarray(obs_loc, dtype=f64)) + np.asarray(offset, dtype=f64)
+    px, py, pz = ringpole[:, 0], ringpole[:, 1], ringpole[:, 2]
+    dot1 = -(px * tempvec[:, 0] + py * tempvec[:, 1] + pz * tempvec[:, 2])
+    dot2 = px * sun_hat[0] + py * sun_hat[1] + pz * sun_hat[2]
+    opposite = ((dot1 > 0.0) & (dot2 < 0.0)) | ((dot1 < 0.0) & (dot2 > 0.0))
+    dark = opposite & (np.abs(dot2) > sun_angular) & ~np.asarray(dashed, dtype=bool)
+
+    return (locs.tolist(), axes1.tolist(), axes2.tolist(), axes3.tolist(), dark.tolist())
+
+
+def _arc_loops(
+    lon1: float,
+    dlon: float,
+    nsteps: int,
+    ring_ax1: Sequence[float],
+    ring_ax2: Sequence[float],
+    ring_loc: Sequence[float],
+) -> tuple[list[list[float]], list[list[float]], list[list[float]]]:
+    """Loop ellipses covering one ring arc, computed for all steps at once.
+
+    Step k spans mean anomalies lon_k to lon_k + dlon, where lon_k is
+    accumulated from lon1 by repeated addition of dlon as in the FORTRAN loop.
+    Each loop is centered on the chord midpoint; its first axis is half the
+    chord and its second axis is LOOP_WIDTH along the radial direction.
+
+    Parameters:
+        lon1: Mean anomaly of the arc start (radians from pericenter).
+        dlon: Step in mean anomaly.
+        nsteps: Number of loops to generate.
+        ring_ax1: Ring major semi-axis vector.
+        ring_ax2: Ring minor semi-axis vector.
+        ring_loc: Ring center.
+
+    Returns:
+        Tuple (loop_axes1, loop_axes2, loop_locs), one [x, y, z] per loop.
+    """
+    import numpy as np
+
+    # The end of step k is the start of step k + 1 (lon + dlon is exactly the
+    # next accumulated lon), so each endpoint's cos/sin is evaluated only once.
+    # An angle-addition recurrence would avoid the trig calls altogether, but
+    # it drifts from the directly evaluated cos/sin in the last bits and the
+    # loops must match FORTRAN, so the (vectorized) trig calls are kept.
+    steps = np.full(nsteps + 2, dlon)
+    steps[0] = lon1 - dlon
+    lons = np.add.accumulate(steps)[1:]
+    ax1 = np.asarray(ring_ax1, dtype=np.float64)
+    ax2 = np.asarray(ring_ax2, dtype=np.float64)
+    ends = np.cos(lons)[:, None] * ax1 + np.sin(lons)[:, None] * ax2
+    vec1 = ends[:-1]
+    vec2 = ends[1:]
+    tmid = 0.5 * vec1 + 0.5 * vec2
+    tx, ty, tz = tmid[:, 0], tmid[:, 1], tmid[:, 2]
+    norms = np.sqrt(tx * tx + ty * ty + tz * tz)[:, None]
+    hat = np.zeros_like(tmid)
+    np.divide(tmid, norms, out=hat, where=norms != 0.0)
+    axes1: list[list[float]] = (vec1 - tmid).tolist()
+    axes2: list[list[float]] = (LOOP_WIDTH * hat).tolist()
+    locs: list[list[float]] = (tmid + np.asarray(ring_loc, dtype=np.float64)).tolist()
+    return axes1, axes2, locs
+
+
 def _vrotv(v: list[float], axis: list[float], angle: float) -> list[float]:
     """Rotate vector v around axis by angle (radians). Port of SPICE VROTV."""
+    return _vrotv_unit(v, _rotation_axis(axis), angle)
+
+
+def _rotation_axis(axis: list[float]) -> list[float]:
+    """Unit rotation axis as used by _vrotv; raises ValueError for a zero axis.
+
+    Callers rotating several vectors about the same axis compute this once
+    and use _vrotv_unit.
+    """
     ax = _vhat(axis)
     if _vnorm(ax) == 0.0:
         raise ValueError('axis must be non-zero')
-    ca = math.cos(angle)
-    sa = math.sin(angle)
-    dot = v[0] * ax[0] + v[1] * ax[1] + v[2] * ax[2]
-    cross = [
-        ax[1] * v[2] - ax[2] * v[1],
-        ax[2] * v[0] - ax[0] * v[2],
-        ax[0] * v[1] - ax[1] * v[0],
+    return ax
+
+
+def _vrotv_unit(v: list[float], ax: list[float], angle: float) -> list[float]:
+    """Rotate vector v around the unit axis ax (from _rotation_axis) by angle."""
+    return _vrotv_unit_cs(v, ax, math.cos(angle), math.sin(angle))
+
+
+def _vrotv_unit_cs(v: list[float], ax: list[float], ca: float, sa: float) -> list[float]:
+    """_vrotv_unit with the rotation's cosine ca and sine sa already evaluated.
+
+    Lets callers that rotate by a fixed angle (see _COS_HALFPI/_SIN_HALFPI)
+    skip the trig calls. Unrolled over the three components on scalar
+    locals; each component is v*cos + (ax x v)*sin + ax*(ax.v)*(1-cos),
+    evaluated in that order.
+    """
+    vx, vy, vz = v
+    axx, axy, axz = ax
+    omc = 1.0 - ca
+    dot = vx * axx + vy * axy + vz * axz
+    return [
+        vx * ca + (axy * vz - axz * vy) * sa + axx * dot * omc,
+        vy * ca + (axz * vx - axx * vz) * sa + axy * dot * omc,
+        vz * ca + (axx * vy - axy * vx) * sa + axz * dot * omc,
     ]
-    return [v[i] * ca + cross[i] * sa + ax[i] * dot * (1.0 - ca) for i in range(3)]
+
+
+@functools.lru_cache(maxsize=8)
+def _ps_prolog(scale_val: float) -> str:
+    """Return the complete PostScript prolog for a moon label font scale.
+
+    The prolog is static apart from the LabelBody scale, which is the same for
+    every view with the same moon label size, so the text is built once.
+    """
+    return _PS_PROLOG_MACROS + _PS_LABEL_BODY_TEMPLATE.format(scale=f'{scale_val:.3f}')
 
 
 def _write_ps_preamble(
@@ -493,79 +1080,45 @@ def _write_ps_preamble(
     align_loc: float,
     moon_labelpts: float,
 ) -> None:
-    """Write PostScript preamble macros, title, captions, credit footer, and axis labels."""
-    eswrit('/MakeDegreeFont {', escher_state)
-    eswrit('findfont dup /CharStrings get /degree known {', escher_state)
-    eswrit('dup length dict /newdict exch def {', escher_state)
-    eswrit('1 index /FID ne { newdict 3 1 roll put }', escher_state)
-    eswrit('{ pop pop } ifelse } forall', escher_state)
-    eswrit('newdict /Encoding get dup length array copy', escher_state)
-    eswrit('newdict exch /Encoding exch put', escher_state)
-    eswrit('newdict /CharStrings get /degree known {', escher_state)
-    eswrit('newdict /Encoding get 8#260 /degree put } if', escher_state)
-    eswrit('newdict true } { pop false } ifelse } def', escher_state)
-    eswrit('/MyFont /Helvetica  MakeDegreeFont { definefont pop } if', escher_state)
-    eswrit('/unscale {10 10 scale} def', escher_state)
-    eswrit('/TextHeight {11} def', escher_state)
-    eswrit('/MyFont findfont TextHeight scalefont setfont', escher_state)
-    eswrit('/LabelBelow {gsave currentpoint translate', escher_state)
-    eswrit('unscale', escher_state)
-    eswrit('dup stringwidth pop -0.5 mul TextHeight -1.3 mul', escher_state)
-    eswrit('moveto show grestore} def', escher_state)
-    eswrit('/LabelLeft {gsave currentpoint translate', escher_state)
-    eswrit('unscale 90 rotate', escher_state)
-    eswrit('dup stringwidth pop -0.5 mul TextHeight 0.3 mul', escher_state)
-    eswrit('moveto show grestore} def', escher_state)
+    """Write PostScript preamble macros, title, captions, credit footer, and axis labels.
+
+    Fixed blocks are module constants; only the title, captions, label scale,
+    and credit line are formatted per call. All of it is assembled in memory
+    and written with a single eswrit.
+    """
     scale_val = (
         min(moon_labelpts / MOON_LABEL_SCALE_DIVISOR, MOON_LABEL_SCALE_CAP)
         if moon_labelpts > 0.0
         else 1.0
     )
-    scale_str = f'{scale_val:.3f}'
-    eswrit('/LabelBody {gsave currentpoint translate', escher_state)
-    eswrit('unscale', escher_state)
-    eswrit(f'{scale_str} {scale_str} scale', escher_state)
-    eswrit('TextHeight 0.2 mul dup', escher_state)
-    eswrit('moveto show grestore} def', escher_state)
-    eswrit('%%EndProlog', escher_state)
-    eswrit('%', escher_state)
+    # Every chunk ends in a newline; the whole preamble is one eswrit.
+    chunks = [_ps_prolog(scale_val)]
     if title.strip():
-        eswrit('gsave unscale 324 756 translate 1.4 1.4 scale', escher_state)
-        _rspk_write_string(title.strip(), escher_state)
-        eswrit('dup stringwidth pop', escher_state)
-        eswrit('-0.5 mul TextHeight neg moveto show grestore', escher_state)
+        chunks.append(
+            'gsave unscale 324 756 translate 1.4 1.4 scale\n'
+            f'({_rspk_escape(title.strip())})\n'
+            'dup stringwidth pop\n-0.5 mul TextHeight neg moveto show grestore\n'
+        )
     if ncaptions > 0:
-        eswrit('gsave unscale', escher_state)
         align_int = _fortran_nint(align_loc) + int(_PS_POINTS_PER_INCH)
-        eswrit(f'{align_int:4d} 162 translate', escher_state)
-        eswrit('0 TextHeight 0.4 mul translate', escher_state)
+        chunks.append(
+            f'gsave unscale\n{align_int:4d} 162 translate\n0 TextHeight 0.4 mul translate\n'
+        )
         for i in range(ncaptions):
-            eswrit('0 TextHeight -1.25 mul translate', escher_state)
-            eswrit('0 0 moveto', escher_state)
             rtext = rcaptions[i].rstrip() if i < len(rcaptions) else ''
-            _rspk_write_string(rtext, escher_state)
-            eswrit('show', escher_state)
             ltext = lcaptions[i].rstrip() if i < len(lcaptions) else ''
-            _rspk_write_string(ltext + '  ', escher_state)
-            eswrit('dup stringwidth pop neg 0 moveto show', escher_state)
-        eswrit('grestore', escher_state)
-    eswrit(
-        f'gsave unscale {int(_PS_POINTS_PER_INCH)} 36 translate 0.5 0.5 scale',
-        escher_state,
-    )
-    eswrit('0 0 moveto', escher_state)
-    date_str = _generated_date_str()
-    footer_text = (
-        f'Generated by the {_rspk_escape(planet_name)} Viewer Tool, '
-        f'PDS Ring-Moon Systems Node, {_rspk_escape(date_str)}'
+            chunks.append(
+                '0 TextHeight -1.25 mul translate\n0 0 moveto\n'
+                f'({_rspk_escape(rtext)})\nshow\n'
+                f'({_rspk_escape(ltext + "  ")})\n'
+                'dup stringwidth pop neg 0 moveto show\n'
+            )
+        chunks.append('grestore\n')
+    chunks.append(
+        _PS_CREDIT_TEMPLATE.format(
+            planet_name=_rspk_escape(planet_name),
+            date_str=_rspk_escape(_generated_date_str()),
+        )
     )
-    eswrit(f'({footer_text})', escher_state)
-    eswrit('show grestore', escher_state)
-    eswrit('gsave unscale', escher_state)
-    eswrit('324 180 translate 1.2 1.2 scale', escher_state)
-    eswrit('(Right Ascension (h m s)) dup stringwidth pop', escher_state)
-    eswrit('-0.5 mul 0 moveto show grestore', escher_state)
-    eswrit('gsave unscale', escher_state)
-    eswrit('36 450 translate 1.2 1.2 scale 90 rotate', escher_state)
-    eswrit('(Declination (d m s)) dup stringwidth pop', escher_state)
-    eswrit('-0.5 mul TextHeight neg moveto show grestore', escher_state)
+    chunks.append(_PS_AXIS_LABELS)
+    eswrit(''.join(chunks), escher_state)
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import array
+import copy
+import functools
+import io
 import math
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from typing import TextIO
+from typing import TextIO, TypeVar
 
 import cspyce
 
@@ -19,10 +24,8 @@ from ephemeris_tools.rendering.draw_view_helpers import (
     _V2,
     DARK_LINE,
     FOV_PTS,
-    HALFPI,
     LIT_LINE,
     LOOP_DLON,
-    LOOP_WIDTH,
     MAX_ARCPTS,
     MAX_MINSIZE,
     MAX_NLOOPS,
@@ -33,16 +36,16 @@ from ephemeris_tools.rendering.draw_view_helpers import (
     NO_LINE,
     PLANET_LATS,
     PLANET_MERIDS,
-    RING_THICKNESS,
     SHADOW_LINE,
     SUN_ID,
     TWOPI,
-    _opsgnd,
+    _arc_loops,
+    _norm3,
+    _ring_shapes,
+    _rotation_axis,
     _rspk_draw_bodies,
     _rspk_draw_rings,
     _vhat,
-    _vnorm,
-    _vrotv,
     _write_ps_preamble,
     camera_matrix,
 )
@@ -59,6 +62,8 @@ from ephemeris_tools.rendering.euclid import (
     euview,
 )
 
+_T = TypeVar('_T')
+
 
 @dataclass(frozen=True)
 class DrawPlanetaryViewOptions:
@@ -115,14 +120,20 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
     with terminators, optional rings (with vertical offsets and opacity), arcs,
     and stars. Frame is J2000 (dec up, RA left). Title and captions supported.
 
+    The PostScript is assembled in memory and written to output in a single
+    write once the page is complete, so an unbuffered output stream does not
+    see one write per PostScript line.
+
     Parameters:
         output: Open text stream for PostScript output.
         options: Geometry and display options (obs_time, fov, center, planet,
             moons, rings, arcs, stars, title, captions). See DrawPlanetaryViewOptions.
     """
+    import numpy as np
+
     from ephemeris_tools.spice.bodmat import bodmat
+    from ephemeris_tools.spice.body_constants import body_radii, has_pole_ra
     from ephemeris_tools.spice.common import get_state
-    from ephemeris_tools.spice.observer import observer_state
     from ephemeris_tools.spice.shifts import spkapp_shifted
 
     spice_state = get_state()
@@ -158,8 +169,9 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
     # ===================================================================
     # Initialize the PostScript file
     # ===================================================================
+    ps_buffer = io.StringIO()
     escher_state = EscherState()
-    escher_state.outuni = output
+    escher_state.outuni = ps_buffer
     escher_state.open = True
     escher_state.external_stream = True
     escher_state.outfil = out_name
@@ -167,7 +179,7 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
     escher_state.fonts = 'Helvetica'
 
     esfile(out_name, escher_state.creator, escher_state.fonts, escher_state)
-    escher_state.outuni = output
+    escher_state.outuni = ps_buffer
     escher_state.open = True
     escher_state.external_stream = True
     write_ps_header(escher_state)
@@ -220,24 +232,28 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
     # Set up observer and planet geometry (SPICE calls)
     # ===================================================================
 
-    # Observer state
-    obs_pv = list(observer_state(options.obs_time))
-
-    # Planet state
-    _planet_pv, planet_dt = cspyce.spkapp(planet_id, options.obs_time, 'J2000', obs_pv[:6], 'LT')
-    planet_dpv = list(_planet_pv)
-    planet_time = options.obs_time - planet_dt
-    planet_pv = list(cspyce.spkssb(planet_id, planet_time, 'J2000'))
-
-    # Planet rotation matrix (J2000 -> body frame)
-    planet_mat = bodmat(planet_id, planet_time)
-
-    # Sun location and radius
-    sun_pv, _sun_dt = cspyce.spkapp(SUN_ID, planet_time, 'J2000', planet_pv[:6], 'LT+S')
-    sun_dpv = list(sun_pv)
+    # Observer, planet, and Sun states plus the planet rotation; memoized for
+    # repeated views of the same epoch.
+    frame = _planet_frame(planet_id, options.obs_time)
+    # Observer position and 6-vector state, sliced once for every use below.
+    obs_state = list(frame.obs_pv[:6])
+    obs_loc = obs_state[:3]
+    planet_dpv = frame.planet_dpv
+    planet_dt = frame.planet_dt
+    planet_pv = frame.planet_pv
+    planet_mat = np.array(frame.planet_mat)
+    sun_dpv = frame.sun_dpv
     sun_loc = [planet_pv[i] + sun_dpv[i] for i in range(3)]
-    sun_radii_arr = cspyce.bodvar(SUN_ID, 'RADII')
-    sun_rad = float(sun_radii_arr[0])
+    sun_rad = body_radii(SUN_ID)[0]
+    # Sun direction and angular radius seen from the planet, used by every ring's
+    # lit/dark test. One norm serves both (_vhat divides by the same norm).
+    sun_dist_val = _norm3(sun_dpv[0], sun_dpv[1], sun_dpv[2])
+    if sun_dist_val > 0.0:
+        sun_hat = [sun_dpv[0] / sun_dist_val, sun_dpv[1] / sun_dist_val, sun_dpv[2] / sun_dist_val]
+        sun_angular = sun_rad / sun_dist_val
+    else:
+        sun_hat = [0.0, 0.0, 0.0]
+        sun_angular = 0.0
 
     # Camera C-matrix
     cmat = camera_matrix(options.center_ra, options.center_dec)
@@ -249,20 +265,22 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
     nbodies = 0
     body_locs: list[list[float]] = []
     body_axes: list[list[list[float]]] = []
-    body_pts: list[float] = []
-    body_dist: list[float] = []
+    body_pts = array.array('d')
+    body_dist = array.array('d')
     body_los: list[list[float]] = []
     body_names_list: list[str] = []
 
     # Body 1: Planet
     nbodies += 1
-    planet_loc = [obs_pv[i] + planet_dpv[i] for i in range(3)]
+    planet_loc = [obs_loc[i] + planet_dpv[i] for i in range(3)]
     body_locs.append(planet_loc)
 
     # planet_mat is J2000→body.  Its rows ARE the body axes in J2000
     # (matching FORTRAN: XPOSE then column extraction).
-    p_radii_arr = cspyce.bodvar(planet_id, 'RADII')
-    planet_axes_scaled = [[planet_mat[i][j] * p_radii_arr[i] for j in range(3)] for i in range(3)]
+    p_radii_arr = body_radii(planet_id)
+    planet_axes_scaled: list[list[float]] = (
+        np.asarray(planet_mat, dtype=np.float64) * np.asarray(p_radii_arr)[:, None]
+    ).tolist()
     body_axes.append(planet_axes_scaled)
     body_pts.append(0.0)
     body_dist.append(0.0)
@@ -274,10 +292,9 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
     dummy_axes = [_vhat(planet_axes_scaled[i]) for i in range(3)]
     body_axes.append(dummy_axes)
     # Locate along optic axis, 2x planet distance
-    tempvec = [planet_dpv[i] for i in range(3)]
-    tdist = _vnorm(tempvec)
+    tdist = _norm3(planet_dpv[0], planet_dpv[1], planet_dpv[2])
     optic_vec = [2.0 * tdist * cmat[j][2] for j in range(3)]
-    dummy_loc = [obs_pv[i] + optic_vec[i] for i in range(3)]
+    dummy_loc = [obs_loc[i] + optic_vec[i] for i in range(3)]
     body_locs.append(dummy_loc)
     body_pts.append(0.0)
     body_dist.append(0.0)
@@ -285,44 +302,43 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
     body_names_list.append(' ')
 
     # Bodies 3+: Moons
-    use_nmoons = min(options.nmoons, MAX_NMOONS)
-    for imoon in range(use_nmoons):
-        if imoon >= len(moon_flags) or not moon_flags[imoon]:
-            continue
-        if imoon >= len(moon_ids):
-            continue
+    # Selected moons that have an ID, found up front so unselected ones cost nothing.
+    use_nmoons = min(options.nmoons, MAX_NMOONS, len(moon_ids))
+    active_moons = [imoon for imoon, flag in enumerate(moon_flags[:use_nmoons]) if flag]
+    for imoon in active_moons:
         mid = moon_ids[imoon]
 
         # Moon position
         try:
-            moon_pv, mdt = spkapp_shifted(mid, options.obs_time, 'J2000', obs_pv[:6], 'LT')
+            moon_pv, mdt = spkapp_shifted(mid, options.obs_time, 'J2000', obs_state, 'LT')
         except Exception:
             continue
-        moon_dpv = list(moon_pv)
-        moon_loc = [obs_pv[i] + moon_dpv[i] for i in range(3)]
+        moon_dpv = np.asarray(moon_pv, dtype=np.float64).tolist()
+        moon_loc = [obs_loc[i] + moon_dpv[i] for i in range(3)]
         body_locs.append(moon_loc)
-        body_los.append(list(moon_dpv[:3]))
+        body_los.append(moon_dpv[:3])
 
         # Moon axes - use moon's own BODMAT if available, else planet_mat
         try:
-            if cspyce.bodfnd(mid, 'POLE_RA'):
-                moon_rot = bodmat(mid, options.obs_time - mdt)
-                moon_mat = [list(row) for row in moon_rot]
+            if has_pole_ra(mid):
+                moon_mat = bodmat(mid, options.obs_time - mdt)
             else:
-                moon_mat = [list(row) for row in planet_mat]
+                moon_mat = planet_mat
         except Exception:
-            moon_mat = [list(row) for row in planet_mat]
+            moon_mat = planet_mat
 
         # moon_mat is J2000→body. Its rows are the body axes in J2000.
         try:
-            m_radii_arr = list(cspyce.bodvar(mid, 'RADII'))
+            m_radii_arr = body_radii(mid)
         except Exception:
-            m_radii_arr = [1.0, 1.0, 1.0]
-        moon_axes = [[moon_mat[i][j] * m_radii_arr[i] for j in range(3)] for i in range(3)]
+            m_radii_arr = (1.0, 1.0, 1.0)
+        moon_axes: list[list[float]] = (
+            np.asarray(moon_mat, dtype=np.float64) * np.asarray(m_radii_arr)[:, None]
+        ).tolist()
         body_axes.append(moon_axes)
 
         # Projected diameter in points
-        moon_dist_km = _vnorm(moon_dpv[:3])
+        moon_dist_km = _norm3(moon_dpv[0], moon_dpv[1], moon_dpv[2])
         body_pts_val = 2.0 * m_radii_arr[0] * FOV_PTS / (moon_dist_km * options.fov)
         body_pts.append(body_pts_val)
 
@@ -331,8 +347,13 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
         body_names_list.append(mname)
 
         # Distance from planet
-        tv = [moon_loc[i] - planet_loc[i] for i in range(3)]
-        body_dist.append(_vnorm(tv))
+        body_dist.append(
+            _norm3(
+                moon_loc[0] - planet_loc[0],
+                moon_loc[1] - planet_loc[1],
+                moon_loc[2] - planet_loc[2],
+            )
+        )
 
         nbodies += 1
 
@@ -346,26 +367,16 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
     _def_f = False
     _def_0 = 0.0
     _def_03 = [0.0, 0.0, 0.0]
-    while len(ring_flags) < use_nrings:
-        ring_flags.append(_def_f)
-    while len(ring_rads) < use_nrings:
-        ring_rads.append(_def_0)
-    while len(ring_eccs) < use_nrings:
-        ring_eccs.append(_def_0)
-    while len(ring_nodes) < use_nrings:
-        ring_nodes.append(_def_0)
-    while len(ring_incs) < use_nrings:
-        ring_incs.append(_def_0)
-    while len(ring_peris) < use_nrings:
-        ring_peris.append(_def_0)
-    while len(ring_elevs) < use_nrings:
-        ring_elevs.append(_def_0)
-    while len(ring_offsets) < use_nrings:
-        ring_offsets.append(_def_03)
-    while len(ring_opaqs) < use_nrings:
-        ring_opaqs.append(_def_f)
-    while len(ring_dashed) < use_nrings:
-        ring_dashed.append(_def_f)
+    _pad(ring_flags, use_nrings, _def_f)
+    _pad(ring_rads, use_nrings, _def_0)
+    _pad(ring_eccs, use_nrings, _def_0)
+    _pad(ring_nodes, use_nrings, _def_0)
+    _pad(ring_incs, use_nrings, _def_0)
+    _pad(ring_peris, use_nrings, _def_0)
+    _pad(ring_elevs, use_nrings, _def_0)
+    _pad(ring_offsets, use_nrings, _def_03)
+    _pad(ring_opaqs, use_nrings, _def_f)
+    _pad(ring_dashed, use_nrings, _def_f)
     use_narcs = min(
         options.narcs,
         len(arc_rings),
@@ -373,30 +384,10 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
         len(arc_minlons),
         len(arc_maxlons),
     )
-    while len(arc_rings) < options.narcs:
-        arc_rings.append(0)
-    while len(arc_flags) < options.narcs:
-        arc_flags.append(_def_f)
-    while len(arc_minlons) < options.narcs:
-        arc_minlons.append(_def_0)
-    while len(arc_maxlons) < options.narcs:
-        arc_maxlons.append(_def_0)
-
-    # Planet pole vector (reversed for Uranus)
-    pole = _vhat(planet_axes_scaled[2])
-    if planet_num == 7:
-        pole = [-pole[0], -pole[1], -pole[2]]
-
-    # Equatorial plane ascending node (J2000)
-    j2000_z = [0.0, 0.0, 1.0]
-    ascnode = [
-        j2000_z[1] * pole[2] - j2000_z[2] * pole[1],
-        j2000_z[2] * pole[0] - j2000_z[0] * pole[2],
-        j2000_z[0] * pole[1] - j2000_z[1] * pole[0],
-    ]
-
-    # Extrapolate planet's relative location at observer-received time
-    offset = [planet_dt * planet_pv[3 + i] for i in range(3)]
+    _pad(arc_rings, options.narcs, 0)
+    _pad(arc_flags, options.narcs, _def_f)
+    _pad(arc_minlons, options.narcs, _def_0)
+    _pad(arc_maxlons, options.narcs, _def_0)
 
     r_ring_locs: list[list[float]] = []
     r_ring_axes1: list[list[float]] = []
@@ -409,7 +400,57 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
     loop_locs: list[list[float]] = []
     loop_axes1: list[list[float]] = []
     loop_axes2: list[list[float]] = []
-    loop_ring: list[int] = []
+    loop_ring = array.array('i')
+
+    # Selected arcs grouped by their 1-based ring number, in arc order, so each
+    # ring visits only its own arcs instead of scanning every arc.
+    arcs_by_ring: dict[int, list[int]] = {}
+    for iarc in range(use_narcs):
+        if arc_flags[iarc]:
+            arcs_by_ring.setdefault(arc_rings[iarc], []).append(iarc)
+
+    # Shapes of all selected rings in one batch, consumed in ring order below.
+    shown = [iring for iring in range(use_nrings) if ring_flags[iring]]
+    shapes: Iterator[tuple[list[float], list[float], list[float], list[float], bool]] = iter(())
+    # With no rings selected (e.g. a moons-only view) the ring frame is never
+    # needed, so the pole, node, and offset are only derived when some are.
+    if shown:
+        # Planet pole vector (reversed for Uranus)
+        pole = _vhat(planet_axes_scaled[2])
+        if planet_num == 7:
+            pole = [-pole[0], -pole[1], -pole[2]]
+
+        # Equatorial plane ascending node (J2000)
+        # Cross product J2000 +Z x pole, specialized for the constant (0, 0, 1).
+        ascnode = [-pole[1], pole[0], 0.0]
+
+        # Every ring's node is rotated about the planet pole; normalize it once.
+        pole_axis = _rotation_axis(pole)
+
+        # Extrapolate planet's relative location at observer-received time
+        offset = [planet_dt * planet_pv[3 + i] for i in range(3)]
+
+        shapes = zip(
+            *_ring_shapes(
+                pole=pole,
+                pole_axis=pole_axis,
+                ascnode=ascnode,
+                planet_loc=planet_loc,
+                obs_loc=obs_loc,
+                offset=offset,
+                sun_hat=sun_hat,
+                sun_angular=sun_angular,
+                nodes=[ring_nodes[i] for i in shown],
+                incs=[ring_incs[i] for i in shown],
+                peris=[ring_peris[i] for i in shown],
+                rads=[ring_rads[i] for i in shown],
+                eccs=[ring_eccs[i] for i in shown],
+                elevs=[ring_elevs[i] for i in shown],
+                offsets=[ring_offsets[i] for i in shown],
+                dashed=[ring_dashed[i] for i in shown],
+            ),
+            strict=True,
+        )
 
     for iring in range(use_nrings):
         # Initialize ring arrays to zeros even for skipped rings
@@ -421,111 +462,41 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
             r_ring_dark.append(False)
             continue
 
-        rad = ring_rads[iring] if iring < len(ring_rads) else 0.0
-        ecc = ring_eccs[iring] if iring < len(ring_eccs) else 0.0
-
-        # Track outermost opaque ring
-        if iring < len(ring_opaqs) and ring_opaqs[iring]:
-            last_opaq = iring + 1  # 1-based
-
-        # Compute ring pole and ascending node from ring inclination/node
-        rn = ring_nodes[iring] if iring < len(ring_nodes) else 0.0
-        ri = ring_incs[iring] if iring < len(ring_incs) else 0.0
-
-        # VROTV(ascnode, pole, ring_nodes(iring)) -> ringnode
-        ringnode = _vrotv(ascnode, pole, rn)
-        # VROTV(pole, ringnode, ring_incs(iring)) -> ringpole
-        ringpole = _vrotv(pole, ringnode, ri)
-        ringpole = _vhat(ringpole)
-
-        # Ring axes
-        ring_ax3 = [RING_THICKNESS * ringpole[i] for i in range(3)]
-        r_ring_axes3.append(ring_ax3)
-
-        # Pericenter direction
-        rp = ring_peris[iring] if iring < len(ring_peris) else 0.0
-        peri = _vrotv(ringnode, ringpole, rp - rn)
-        peri = _vhat(peri)
-        ring_ax1 = [rad * peri[i] for i in range(3)]
+        ring_loc, ring_ax1, ring_ax2, ring_ax3, ring_dark = next(shapes)
+        r_ring_locs.append(ring_loc)
         r_ring_axes1.append(ring_ax1)
-
-        # Minor axis = peri rotated 90 degrees around ringpole
-        minor_dir = _vrotv(peri, ringpole, HALFPI)
-        ring_ax2 = [rad * math.sqrt(1.0 - ecc * ecc) * minor_dir[i] for i in range(3)]
         r_ring_axes2.append(ring_ax2)
+        r_ring_axes3.append(ring_ax3)
+        r_ring_dark.append(ring_dark)
 
-        # Ring center = planet_loc - ecc * major_axis + elevation + offset
-        ring_loc = [-ecc * ring_ax1[i] + planet_loc[i] for i in range(3)]
-        # Add vertical elevation
-        re = ring_elevs[iring] if iring < len(ring_elevs) else 0.0
-        ring_loc = [ring_loc[i] + re * pole[i] for i in range(3)]
-
-        # Add ring offset
-        if iring < len(ring_offsets):
-            ro = ring_offsets[iring]
-            ring_loc = [ring_loc[i] + ro[i] for i in range(3)]
-
-        r_ring_locs.append(ring_loc)
-
-        # Determine if ring is dark (observer and Sun on opposite sides)
-        tempvec_obs = [ring_loc[i] - obs_pv[i] + offset[i] for i in range(3)]
-        dot1 = -(
-            ringpole[0] * tempvec_obs[0]
-            + ringpole[1] * tempvec_obs[1]
-            + ringpole[2] * tempvec_obs[2]
-        )
-        sun_hat = _vhat(sun_dpv[:3])
-        dot2 = ringpole[0] * sun_hat[0] + ringpole[1] * sun_hat[1] + ringpole[2] * sun_hat[2]
+        # Track outermost opaque ring
+        if ring_opaqs[iring]:
+            last_opaq = iring + 1  # 1-based
+        rp = ring_peris[iring]
 
-        is_dashed = ring_dashed[iring] if iring < len(ring_dashed) else False
-        if is_dashed:
-            r_ring_dark.append(False)
-        else:
-            sun_dist_val = _vnorm(sun_dpv[:3])
-            sun_angular = sun_rad / sun_dist_val if sun_dist_val > 0 else 0
-            r_ring_dark.append(_opsgnd(dot1, dot2) and abs(dot2) > sun_angular)
-
-        # Arc loops for this ring
-        for iarc in range(use_narcs):
-            if iarc >= len(arc_rings) or arc_rings[iarc] != iring + 1:  # 1-based comparison
-                continue
-            if iarc >= len(arc_flags) or not arc_flags[iarc]:
-                continue
+        # Arc loops for this ring. Loops past MAX_NLOOPS in total are dropped,
+        # as in FORTRAN, so once the cap is reached the remaining arcs are
+        # skipped (the ring itself still needs its geometry above).
+        for iarc in arcs_by_ring.get(iring + 1, ()):
+            if nloops >= MAX_NLOOPS:
+                break
 
             # Mean anomaly range
-            lon1 = (arc_minlons[iarc] if iarc < len(arc_minlons) else 0.0) - rp
-            lon2 = (arc_maxlons[iarc] if iarc < len(arc_maxlons) else 0.0) - rp
+            lon1 = arc_minlons[iarc] - rp
+            lon2 = arc_maxlons[iarc] - rp
             if lon2 < lon1:
                 lon2 += TWOPI
 
             nsteps = max(int((lon2 - lon1) / LOOP_DLON), 1)
             dlon = (lon2 - lon1) / nsteps
 
-            lon = lon1 - dlon
-            for _istep in range(nsteps):
-                lon += dlon
-                if nloops >= MAX_NLOOPS:
-                    break
-                nloops += 1
-
-                # Vectors from ring center to loop ends
-                vec1 = [math.cos(lon) * ring_ax1[i] + math.sin(lon) * ring_ax2[i] for i in range(3)]
-                vec2 = [
-                    math.cos(lon + dlon) * ring_ax1[i] + math.sin(lon + dlon) * ring_ax2[i]
-                    for i in range(3)
-                ]
-
-                # Loop center and axes
-                tmid = [0.5 * vec1[i] + 0.5 * vec2[i] for i in range(3)]
-                la1 = [vec1[i] - tmid[i] for i in range(3)]
-                la2 = _vhat(tmid)
-                la2 = [LOOP_WIDTH * la2[i] for i in range(3)]
-                ll = [tmid[i] + ring_loc[i] for i in range(3)]
-
-                loop_axes1.append(la1)
-                loop_axes2.append(la2)
-                loop_locs.append(ll)
-                loop_ring.append(iring + 1)  # 1-based
+            nuse = min(nsteps, MAX_NLOOPS - nloops)
+            la1s, la2s, lls = _arc_loops(lon1, dlon, nuse, ring_ax1, ring_ax2, ring_loc)
+            loop_axes1.extend(la1s)
+            loop_axes2.extend(la2s)
+            loop_locs.extend(lls)
+            loop_ring.extend([iring + 1] * nuse)  # 1-based
+            nloops += nuse
 
     # ===================================================================
     # Render scene based on ring_method
@@ -538,32 +509,57 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
     semi_transparent_method = 1
     # OPAQUE_METHOD = 2
 
+    # Arguments shared by every pass; each call below passes only what differs.
+    # The Sun, observer, and camera are the same for every EUGEOM call, and
+    # eugeom copies what it keeps, so these lists are built once.
+    define_scene = functools.partial(
+        eugeom, 1, [sun_loc], [sun_rad], obs_loc, cmat, euclid_state=euclid_state
+    )
+    draw_bodies = functools.partial(
+        _rspk_draw_bodies,
+        nbodies=nbodies,
+        body_pts=body_pts,
+        body_names=body_names_list,
+        body_dist=body_dist,
+        body_diampts=use_diampts,
+        pmerids=pmerids,
+        plats=plats,
+        mmerids=mmerids,
+        mlats=mlats,
+        euclid_state=euclid_state,
+        view_state=view_state,
+        escher_state=escher_state,
+    )
+    draw_rings = functools.partial(
+        _rspk_draw_rings,
+        ring_flags=ring_flags,
+        ring_locs=r_ring_locs,
+        ring_axes1=r_ring_axes1,
+        ring_axes2=r_ring_axes2,
+        ring_dark=r_ring_dark,
+        ring_dashed=ring_dashed,
+        nloops=nloops,
+        loop_locs=loop_locs,
+        loop_axes1=loop_axes1,
+        loop_axes2=loop_axes2,
+        loop_ring=loop_ring,
+        arc_width=use_arcpts,
+        lit_line=LIT_LINE,
+        dark_line=DARK_LINE,
+        shadow_line=SHADOW_LINE,
+        term_line=term_line,
+        euclid_state=euclid_state,
+        view_state=view_state,
+        escher_state=escher_state,
+    )
+
     if options.ring_method == transparent_method or last_opaq == 0:
         # Case 0: Transparent — simplest case
-        eugeom(
-            1,
-            [sun_loc],
-            [sun_rad],
-            obs_pv[:3],
-            [cmat[0], cmat[1], cmat[2]],
-            nbodies,
-            body_locs,
-            body_axes,
-            euclid_state,
-        )
+        define_scene(nbodies, body_locs, body_axes)
 
-        _rspk_draw_bodies(
-            nbodies=nbodies,
-            body_pts=body_pts,
-            body_names=body_names_list,
-            body_dist=body_dist,
-            body_diampts=use_diampts,
+        draw_bodies(
             update_names=True,
             mindist=0.0,
-            pmerids=pmerids,
-            plats=plats,
-            mmerids=mmerids,
-            mlats=mlats,
             lit_line=LIT_LINE,
             dark_line=DARK_LINE,
             term_line=term_line,
@@ -571,63 +567,20 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
             dark_line2=DARK_LINE,
             term_line2=term_line,
             prime_pts=options.prime_pts,
-            euclid_state=euclid_state,
-            view_state=view_state,
-            escher_state=escher_state,
         )
 
-        _rspk_draw_rings(
-            iring1=1,
-            iring2=use_nrings,
-            ring_flags=ring_flags,
-            ring_locs=r_ring_locs,
-            ring_axes1=r_ring_axes1,
-            ring_axes2=r_ring_axes2,
-            ring_dark=r_ring_dark,
-            ring_dashed=ring_dashed,
-            nloops=nloops,
-            loop_locs=loop_locs,
-            loop_axes1=loop_axes1,
-            loop_axes2=loop_axes2,
-            loop_ring=loop_ring,
-            arc_width=use_arcpts,
-            lit_line=LIT_LINE,
-            dark_line=DARK_LINE,
-            shadow_line=SHADOW_LINE,
-            term_line=term_line,
-            euclid_state=euclid_state,
-            view_state=view_state,
-            escher_state=escher_state,
-        )
+        draw_rings(iring1=1, iring2=use_nrings)
 
     elif options.ring_method == semi_transparent_method:
         # Case 1: Semi-transparent — two passes
         lo = last_opaq - 1  # 0-based index for outermost opaque ring
 
         # First pass: unlit bodies
-        eugeom(
-            1,
-            [sun_loc],
-            [sun_rad],
-            obs_pv[:3],
-            [cmat[0], cmat[1], cmat[2]],
-            nbodies,
-            body_locs,
-            body_axes,
-            euclid_state,
-        )
-        _rspk_draw_bodies(
-            nbodies=nbodies,
-            body_pts=body_pts,
-            body_names=body_names_list,
-            body_dist=body_dist,
-            body_diampts=use_diampts,
+        define_scene(nbodies, body_locs, body_axes)
+        bodies_only_geom = euclid_state.save_geometry()
+        draw_bodies(
             update_names=True,
             mindist=ring_rads[lo] if lo < len(ring_rads) else 0.0,
-            pmerids=pmerids,
-            plats=plats,
-            mmerids=mmerids,
-            mlats=mlats,
             lit_line=DARK_LINE,
             dark_line=DARK_LINE,
             term_line=DARK_LINE,
@@ -635,39 +588,17 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
             dark_line2=DARK_LINE,
             term_line2=term_line,
             prime_pts=options.prime_pts,
-            euclid_state=euclid_state,
-            view_state=view_state,
-            escher_state=escher_state,
         )
 
         # Redefine with outermost opaque ring as flat ellipsoid
         ext_locs = [*body_locs, r_ring_locs[lo]]
         ext_axes = [*body_axes, [r_ring_axes1[lo], r_ring_axes2[lo], r_ring_axes3[lo]]]
-        eugeom(
-            1,
-            [sun_loc],
-            [sun_rad],
-            obs_pv[:3],
-            [cmat[0], cmat[1], cmat[2]],
-            nbodies + 1,
-            ext_locs,
-            ext_axes,
-            euclid_state,
-        )
+        define_scene(nbodies + 1, ext_locs, ext_axes)
 
         # Re-draw lit, but not interior moons
-        _rspk_draw_bodies(
-            nbodies=nbodies,
-            body_pts=body_pts,
-            body_names=body_names_list,
-            body_dist=body_dist,
-            body_diampts=use_diampts,
+        draw_bodies(
             update_names=False,
             mindist=ring_rads[lo] if lo < len(ring_rads) else 0.0,
-            pmerids=pmerids,
-            plats=plats,
-            mmerids=mmerids,
-            mlats=mlats,
             lit_line=LIT_LINE,
             dark_line=DARK_LINE,
             term_line=term_line,
@@ -675,9 +606,6 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
             dark_line2=NO_LINE,
             term_line2=NO_LINE,
             prime_pts=options.prime_pts,
-            euclid_state=euclid_state,
-            view_state=view_state,
-            escher_state=escher_state,
         )
 
         # Draw opaque ring invisibly
@@ -686,56 +614,16 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
         )
 
         # Exterior rings
-        _rspk_draw_rings(
-            iring1=last_opaq + 1,
-            iring2=use_nrings,
-            ring_flags=ring_flags,
-            ring_locs=r_ring_locs,
-            ring_axes1=r_ring_axes1,
-            ring_axes2=r_ring_axes2,
-            ring_dark=r_ring_dark,
-            ring_dashed=ring_dashed,
-            nloops=nloops,
-            loop_locs=loop_locs,
-            loop_axes1=loop_axes1,
-            loop_axes2=loop_axes2,
-            loop_ring=loop_ring,
-            arc_width=use_arcpts,
-            lit_line=LIT_LINE,
-            dark_line=DARK_LINE,
-            shadow_line=SHADOW_LINE,
-            term_line=term_line,
-            euclid_state=euclid_state,
-            view_state=view_state,
-            escher_state=escher_state,
-        )
+        draw_rings(iring1=last_opaq + 1, iring2=use_nrings)
 
-        # Re-define without rings
-        eugeom(
-            1,
-            [sun_loc],
-            [sun_rad],
-            obs_pv[:3],
-            [cmat[0], cmat[1], cmat[2]],
-            nbodies,
-            body_locs,
-            body_axes,
-            euclid_state,
-        )
+        # Re-define without rings: same inputs as the first pass, so restore
+        # that geometry instead of recomputing it.
+        euclid_state.restore_geometry(bodies_only_geom)
 
         # Set up bodies without drawing (for correct ring lighting)
-        _rspk_draw_bodies(
-            nbodies=nbodies,
-            body_pts=body_pts,
-            body_names=body_names_list,
-            body_dist=body_dist,
-            body_diampts=use_diampts,
+        draw_bodies(
             update_names=False,
             mindist=0.0,
-            pmerids=pmerids,
-            plats=plats,
-            mmerids=mmerids,
-            mlats=mlats,
             lit_line=NO_LINE,
             dark_line=NO_LINE,
             term_line=NO_LINE,
@@ -743,35 +631,10 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
             dark_line2=NO_LINE,
             term_line2=NO_LINE,
             prime_pts=0.0,
-            euclid_state=euclid_state,
-            view_state=view_state,
-            escher_state=escher_state,
         )
 
         # Interior rings
-        _rspk_draw_rings(
-            iring1=1,
-            iring2=last_opaq,
-            ring_flags=ring_flags,
-            ring_locs=r_ring_locs,
-            ring_axes1=r_ring_axes1,
-            ring_axes2=r_ring_axes2,
-            ring_dark=r_ring_dark,
-            ring_dashed=ring_dashed,
-            nloops=nloops,
-            loop_locs=loop_locs,
-            loop_axes1=loop_axes1,
-            loop_axes2=loop_axes2,
-            loop_ring=loop_ring,
-            arc_width=use_arcpts,
-            lit_line=LIT_LINE,
-            dark_line=DARK_LINE,
-            shadow_line=SHADOW_LINE,
-            term_line=term_line,
-            euclid_state=euclid_state,
-            view_state=view_state,
-            escher_state=escher_state,
-        )
+        draw_rings(iring1=1, iring2=last_opaq)
 
     else:
         # Case 2: Opaque
@@ -779,30 +642,11 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
 
         ext_locs = [*body_locs, r_ring_locs[lo]]
         ext_axes = [*body_axes, [r_ring_axes1[lo], r_ring_axes2[lo], r_ring_axes3[lo]]]
-        eugeom(
-            1,
-            [sun_loc],
-            [sun_rad],
-            obs_pv[:3],
-            [cmat[0], cmat[1], cmat[2]],
-            nbodies + 1,
-            ext_locs,
-            ext_axes,
-            euclid_state,
-        )
+        define_scene(nbodies + 1, ext_locs, ext_axes)
 
-        _rspk_draw_bodies(
-            nbodies=nbodies,
-            body_pts=body_pts,
-            body_names=body_names_list,
-            body_dist=body_dist,
-            body_diampts=use_diampts,
+        draw_bodies(
             update_names=True,
             mindist=ring_rads[lo] if lo < len(ring_rads) else 0.0,
-            pmerids=pmerids,
-            plats=plats,
-            mmerids=mmerids,
-            mlats=mlats,
             lit_line=LIT_LINE,
             dark_line=DARK_LINE,
             term_line=term_line,
@@ -810,65 +654,21 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
             dark_line2=NO_LINE,
             term_line2=NO_LINE,
             prime_pts=options.prime_pts,
-            euclid_state=euclid_state,
-            view_state=view_state,
-            escher_state=escher_state,
         )
 
         eubody(
             nbodies + 1, 0, 0, 1, NO_LINE, NO_LINE, NO_LINE, euclid_state, view_state, escher_state
         )
 
-        _rspk_draw_rings(
-            iring1=last_opaq + 1,
-            iring2=use_nrings,
-            ring_flags=ring_flags,
-            ring_locs=r_ring_locs,
-            ring_axes1=r_ring_axes1,
-            ring_axes2=r_ring_axes2,
-            ring_dark=r_ring_dark,
-            ring_dashed=ring_dashed,
-            nloops=nloops,
-            loop_locs=loop_locs,
-            loop_axes1=loop_axes1,
-            loop_axes2=loop_axes2,
-            loop_ring=loop_ring,
-            arc_width=use_arcpts,
-            lit_line=LIT_LINE,
-            dark_line=DARK_LINE,
-            shadow_line=SHADOW_LINE,
-            term_line=term_line,
-            euclid_state=euclid_state,
-            view_state=view_state,
-            escher_state=escher_state,
-        )
+        draw_rings(iring1=last_opaq + 1, iring2=use_nrings)
 
         # Re-define without rings
-        eugeom(
-            1,
-            [sun_loc],
-            [sun_rad],
-            obs_pv[:3],
-            [cmat[0], cmat[1], cmat[2]],
-            nbodies,
-            body_locs,
-            body_axes,
-            euclid_state,
-        )
+        define_scene(nbodies, body_locs, body_axes)
 
         # Re-draw interior moons
-        _rspk_draw_bodies(
-            nbodies=nbodies,
-            body_pts=body_pts,
-            body_names=body_names_list,
-            body_dist=body_dist,
-            body_diampts=use_diampts,
+        draw_bodies(
             update_names=True,
             mindist=ring_rads[lo] if lo < len(ring_rads) else 0.0,
-            pmerids=pmerids,
-            plats=plats,
-            mmerids=mmerids,
-            mlats=mlats,
             lit_line=NO_LINE,
             dark_line=NO_LINE,
             term_line=NO_LINE,
@@ -876,35 +676,10 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
             dark_line2=DARK_LINE,
             term_line2=term_line,
             prime_pts=options.prime_pts,
-            euclid_state=euclid_state,
-            view_state=view_state,
-            escher_state=escher_state,
         )
 
         # Interior rings
-        _rspk_draw_rings(
-            iring1=1,
-            iring2=last_opaq,
-            ring_flags=ring_flags,
-            ring_locs=r_ring_locs,
-            ring_axes1=r_ring_axes1,
-            ring_axes2=r_ring_axes2,
-            ring_dark=r_ring_dark,
-            ring_dashed=ring_dashed,
-            nloops=nloops,
-            loop_locs=loop_locs,
-            loop_axes1=loop_axes1,
-            loop_axes2=loop_axes2,
-            loop_ring=loop_ring,
-            arc_width=use_arcpts,
-            lit_line=LIT_LINE,
-            dark_line=DARK_LINE,
-            shadow_line=SHADOW_LINE,
-            term_line=term_line,
-            euclid_state=euclid_state,
-            view_state=view_state,
-            escher_state=escher_state,
-        )
+        draw_rings(iring1=1, iring2=last_opaq)
 
     draw_view_box_labels_stars_close(
         escher_state=escher_state,
@@ -926,3 +701,77 @@ def draw_planetary_view(output: TextIO, options: DrawPlanetaryViewOptions) -> No
         star_labels=options.star_labels,
         star_diampts=options.star_diampts,
     )
+    output.write(ps_buffer.getvalue())
+
+
+def _pad(values: list[_T], n: int, default: _T) -> None:
+    """Extend values in place with default until it has at least n entries.
+
+    Each added entry is a shallow copy of default, so padded entries never
+    share a mutable default (e.g. a ring offset list) with one another.
+    """
+    k = n - len(values)
+    if k > 0:
+        values.extend([copy.copy(default) for _ in range(k)])
+
+
+@dataclass(frozen=True)
+class _PlanetFrame:
+    """Observer, planet, and Sun geometry at one epoch (immutable, cacheable)."""
+
+    obs_pv: tuple[float, ...]
+    planet_dpv: tuple[float, ...]
+    planet_dt: float
+    planet_pv: tuple[float, ...]
+    planet_mat: tuple[tuple[float, ...], ...]
+    sun_dpv: tuple[float, ...]
+
+
+def _planet_frame(planet_id: int, obs_time: float) -> _PlanetFrame:
+    """Return the observer/planet/Sun states for planet_id at obs_time.
+
+    Results are memoized on everything they depend on: the planet and time,
+    the observer settings, the time shifts, and the kernel generation (which
+    advances whenever kernels are loaded).
+    """
+    from ephemeris_tools.spice.common import get_state
+
+    st = get_state()
+    return _planet_frame_cached(
+        planet_id,
+        obs_time,
+        st.kernel_generation,
+        (st.obs_id, st.obs_is_set, st.obs_lat, st.obs_lon, st.obs_alt),
+        tuple(zip(st.shift_id[: st.nshifts], st.shift_dt[: st.nshifts], strict=True)),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _planet_frame_cached(
+    planet_id: int,
+    obs_time: float,
+    _kernel_generation: int,
+    _observer: tuple[object, ...],
+    _shifts: tuple[tuple[int, float], ...],
+) -> _PlanetFrame:
+    """Compute a _PlanetFrame; the trailing arguments only key the cache."""
+    import numpy as np
+
+    from ephemeris_tools.spice.bodmat import bodmat
+    from ephemeris_tools.spice.observer import observer_state
+
+    obs_pv = observer_state(obs_time)
+    planet_dpv, planet_dt = cspyce.spkapp(planet_id, obs_time, 'J2000', obs_pv[:6], 'LT')
+    planet_time = obs_time - planet_dt
+    planet_pv = np.asarray(cspyce.spkssb(planet_id, planet_time, 'J2000'), dtype=np.float64)
+    # Planet rotation matrix (J2000 -> body frame)
+    planet_mat = bodmat(planet_id, planet_time)
+    sun_dpv, _sun_dt = cspyce.spkapp(SUN_ID, planet_time, 'J2000', planet_pv[:6].tolist(), 'LT+S')
+    return _PlanetFrame(
+        obs_pv=tuple(obs_pv.tolist()),
+        planet_dpv=tuple(np.asarray(planet_dpv, dtype=np.float64).tolist()),
+        planet_dt=float(planet_dt),
+        planet_pv=tuple(planet_pv.tolist()),
+        planet_mat=tuple(tuple(row) for row in np.asarray(planet_mat, dtype=np.float64).tolist()),
+        sun_dpv=tuple(np.asarray(sun_dpv, dtype=np.float64).tolist()),
+    )
@@ -12,6 +12,12 @@ from ephemeris_tools.rendering.escher.constants import (
 )
 from ephemeris_tools.rendering.escher.state import EscherState
 
+# Write buffer size for output files opened by Escher itself.
+_FILE_BUFFER = 1 << 16
+
+# Gray-level commands as complete output lines.
+_GRAY_LINES = tuple(f'{gray}\n' for gray in _GRAY)
+
 
 def _opairi(x: int, y: int, suffix: str) -> str:
     """Format ordered pair of integers as 'X Y suffix' (matches OPAIRI + MOVETO(2:))."""
@@ -25,6 +31,39 @@ def _nint(x: float) -> int:
     return -int(-x + 0.5)
 
 
+def _ps_header_lines(outfil: str, creator: str, fonts: str) -> list[str]:
+    """Return the PostScript header lines (newline-terminated) written by ESDR07.
+
+    The %%Title is the last path component of outfil.
+    """
+    f2 = len(outfil)
+    f1 = f2
+    for i in range(f2 - 1, -1, -1):
+        if outfil[i] in '/:]':
+            f1 = i
+            break
+    title = outfil[f1 + 1 : f2] if f1 < f2 else outfil
+    return [
+        '%!PS-Adobe-2.0 EPSF-2.0\n',
+        f'%%Title: {title}\n',
+        f'%%Creator: {creator.rstrip()}\n',
+        '%%BoundingBox: 0 0 612 792\n',
+        '%%Pages: 1\n',
+        f'%%DocumentFonts: {fonts.rstrip()}\n',
+        '%%EndComments\n',
+        '% \n',
+        '0.1 0.1 scale\n',
+        '8 setlinewidth\n',
+        '1 setlinecap\n',
+        '1 setlinejoin\n',
+        '/L {lineto} def\n',
+        '/M {moveto} def\n',
+        '/N {newpath} def\n',
+        '/G {setgray} def\n',
+        '/S {stroke} def\n',
+    ]
+
+
 def esfile(
     filename: str,
     creator: str,
@@ -55,36 +94,10 @@ def _ensure_open(state: EscherState) -> TextIO:
         return state.outuni
     state.open = True
     outfil = state.outfil.strip() or 'escher.ps'
-    # Extract basename for %%Title (last path component)
-    f2 = len(outfil)
-    f1 = f2
-    for i in range(f2 - 1, -1, -1):
-        if outfil[i] in '/:]':
-            f1 = i
-            break
-    title = outfil[f1 + 1 : f2] if f1 < f2 else outfil
-    creator_nb = state.creator.rstrip()
-    fonts_nb = state.fonts.rstrip()
     # File is stored in state.outuni and must stay open for subsequent writes (SIM115).
-    f = open(outfil, 'w', encoding='utf-8')  # noqa: SIM115
+    f = open(outfil, 'w', encoding='utf-8', buffering=_FILE_BUFFER)  # noqa: SIM115
     state.outuni = f
-    f.write('%!PS-Adobe-2.0 EPSF-2.0\n')
-    f.write(f'%%Title: {title}\n')
-    f.write(f'%%Creator: {creator_nb}\n')
-    f.write('%%BoundingBox: 0 0 612 792\n')
-    f.write('%%Pages: 1\n')
-    f.write(f'%%DocumentFonts: {fonts_nb}\n')
-    f.write('%%EndComments\n')
-    f.write('% \n')
-    f.write('0.1 0.1 scale\n')
-    f.write('8 setlinewidth\n')
-    f.write('1 setlinecap\n')
-    f.write('1 setlinejoin\n')
-    f.write('/L {lineto} def\n')
-    f.write('/M {moveto} def\n')
-    f.write('/N {newpath} def\n')
-    f.write('/G {setgray} def\n')
-    f.write('/S {stroke} def\n')
+    f.writelines(_ps_header_lines(outfil, state.creator, state.fonts))
     return f
 
 
@@ -96,33 +109,7 @@ def write_ps_header(state: EscherState) -> None:
     if state.outuni is None:
         return
     outfil = (state.outfil or '').strip() or 'view.ps'
-    f2 = len(outfil)
-    f1 = f2
-    for i in range(f2 - 1, -1, -1):
-        if outfil[i] in '/:]':
-            f1 = i
-            break
-    title = outfil[f1 + 1 : f2] if f1 < f2 else outfil
-    creator_nb = (state.creator or '').rstrip()
-    fonts_nb = (state.fonts or '').rstrip()
-    f = state.outuni
-    f.write('%!PS-Adobe-2.0 EPSF-2.0\n')
-    f.write(f'%%Title: {title}\n')
-    f.write(f'%%Creator: {creator_nb}\n')
-    f.write('%%BoundingBox: 0 0 612 792\n')
-    f.write('%%Pages: 1\n')
-    f.write(f'%%DocumentFonts: {fonts_nb}\n')
-    f.write('%%EndComments\n')
-    f.write('% \n')
-    f.write('0.1 0.1 scale\n')
-    f.write('8 setlinewidth\n')
-    f.write('1 setlinecap\n')
-    f.write('1 setlinejoin\n')
-    f.write('/L {lineto} def\n')
-    f.write('/M {moveto} def\n')
-    f.write('/N {newpath} def\n')
-    f.write('/G {setgray} def\n')
-    f.write('/S {stroke} def\n')
+    state.outuni.writelines(_ps_header_lines(outfil, state.creator or '', state.fonts or ''))
 
 
 def esopen(state: EscherState) -> None:
@@ -151,6 +138,8 @@ def esdr07(nsegs: int, segs: list[int], state: EscherState) -> None:
     if nsegs < 5:
         return
     f = _ensure_open(state)
+    # The PostScript for every path is collected here and written in one call.
+    out: list[str] = []
     # Group connected segments with same color
     offset = 0
     bp = segs[offset]
@@ -190,24 +179,28 @@ def esdr07(nsegs: int, segs: list[int], state: EscherState) -> None:
                 else:
                     xarray[count - 1] = xarray[count - 1] - 1
             if lstcol >= 0:
-                f.write('N\n')
-                f.write(_opairi(xarray[0], yarray[0], 'M') + '\n')
-                state.xsave = xarray[0]
-                state.ysave = yarray[0]
-                lastln = _opairi(xarray[0], yarray[0], 'L')
+                lastx = xarray[0]
+                lasty = yarray[0]
+                out.append(f'N\n{lastx} {lasty} M\n')
+                state.xsave = lastx
+                state.ysave = lasty
+                # A lineto repeating the previous point is dropped; comparing the integer
+                # coordinates is the same test as comparing the OPAIRI strings.
                 for m in range(1, count):
-                    lineto = _opairi(xarray[m], yarray[m], 'L')
-                    if lineto != lastln:
-                        f.write(lineto + '\n')
-                        state.xsave = xarray[m]
-                        state.ysave = yarray[m]
+                    x = xarray[m]
+                    y = yarray[m]
+                    if x != lastx or y != lasty:
+                        out.append(f'{x} {y} L\n')
+                        state.xsave = x
+                        state.ysave = y
                         state.drawn = True
-                    lastln = lineto
+                    lastx = x
+                    lasty = y
                 col_out = 1 if lstcol > 10 else lstcol
                 if col_out != state.oldcol and col_out >= 0:
-                    f.write(_GRAY[min(col_out, 10)] + '\n')
+                    out.append(_GRAY_LINES[min(col_out, 10)])
                     state.oldcol = col_out
-                f.write('S\n')
+                out.append('S\n')
 
             count = 2
             xarray = [bp, ep]
@@ -225,24 +218,29 @@ def esdr07(nsegs: int, segs: list[int], state: EscherState) -> None:
         else:
             xarray[count - 1] = xarray[count - 1] - 1
     if lstcol >= 0:
-        f.write('N\n')
-        f.write(_opairi(xarray[0], yarray[0], 'M') + '\n')
-        state.xsave = xarray[0]
-        state.ysave = yarray[0]
-        lastln = _opairi(xarray[0], yarray[0], 'L')
+        lastx = xarray[0]
+        lasty = yarray[0]
+        out.append(f'N\n{lastx} {lasty} M\n')
+        state.xsave = lastx
+        state.ysave = lasty
+        # A lineto repeating the previous point is dropped; comparing the integer
+        # coordinates is the same test as comparing the OPAIRI strings.
         for m in range(1, count):
-            lineto = _opairi(xarray[m], yarray[m], 'L')
-            if lineto != lastln:
-                f.write(lineto + '\n')
-                state.xsave = xarray[m]
-                state.ysave = yarray[m]
+            x = xarray[m]
+            y = yarray[m]
+            if x != lastx or y != lasty:
+                out.append(f'{x} {y} L\n')
+                state.xsave = x
+                state.ysave = y
                 state.drawn = True
-            lastln = lineto
+            lastx = x
+            lasty = y
         col_out = 1 if lstcol > 10 else lstcol
         if col_out != state.oldcol and col_out >= 0:
-            f.write(_GRAY[min(col_out, 10)] + '\n')
+            out.append(_GRAY_LINES[min(col_out, 10)])
             state.oldcol = col_out
-        f.write('S\n')
+        out.append('S\n')
+    f.write(''.join(out))
 
 
 def eslwid(points: float, state: EscherState) -> None:
@@ -274,9 +272,11 @@ def eswrit(string: str, state: EscherState) -> None:
     """
     if state.outuni is None:
         return
-    state.outuni.write(string)
+    # One write per call: the newline is appended to the string rather than
+    # written separately.
     if string and not string.endswith('\n'):
-        state.outuni.write('\n')
+        string += '\n'
+    state.outuni.write(string)
 
 
 def esmove(state: EscherState) -> None:
@@ -315,20 +315,23 @@ def escl07(hmin: int, hmax: int, vmin: int, vmax: int, state: EscherState) -> No
             state.outuni = None
             state.open = False
         return
-    f = state.outuni
-    f.write('% \n')
-    f.write('% CLEAR PART OF THE PAGE\n')
-    f.write('% \n')
-    f.write('N\n')
-    f.write(_opairi(hmin, vmin, 'M') + '\n')
-    f.write(_opairi(hmin, vmax, 'L') + '\n')
-    f.write(_opairi(hmax, vmax, 'L') + '\n')
-    f.write(_opairi(hmax, vmin, 'L') + '\n')
-    f.write(_opairi(hmin, vmin, 'L') + '\n')
-    f.write('closepath\n')
-    f.write('1 G\n')
-    f.write('fill\n')
-    f.write('0 G\n')
+    state.outuni.writelines(
+        [
+            '% \n',
+            '% CLEAR PART OF THE PAGE\n',
+            '% \n',
+            'N\n',
+            _opairi(hmin, vmin, 'M') + '\n',
+            _opairi(hmin, vmax, 'L') + '\n',
+            _opairi(hmax, vmax, 'L') + '\n',
+            _opairi(hmax, vmin, 'L') + '\n',
+            _opairi(hmin, vmin, 'L') + '\n',
+            'closepath\n',
+            '1 G\n',
+            'fill\n',
+            '0 G\n',
+        ]
+    )
     state.oldcol = 1
 
 
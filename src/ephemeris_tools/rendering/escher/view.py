@@ -170,21 +170,6 @@ def _esclip(
     return (x1, y1, x2, y2, False)
 
 
-def _esmap2(x: float, y: float, view_state: EscherViewState) -> tuple[int, int]:
-    """Map point in projection (x,y) space to device pixel/line (port of ESMAP2).
-
-    Parameters:
-        x, y: Coordinates in projection (FOV) space.
-        view_state: View state from esview (must be initialized).
-
-    Returns:
-        Tuple of (pixel, line) in device coordinates.
-    """
-    p = _nint(view_state._pcen + view_state._ux * (x - view_state._xcen))
-    line = _nint(view_state._lcen + view_state._uy * (y - view_state._ycen))
-    return (p, line)
-
-
 # Epsilon for points near the camera plane (z=0) to avoid zero division in projection
 _ESDRAW_EPS = 1e-12
 
@@ -285,14 +270,28 @@ def esdraw(
     )
     if not inside:
         return
-    p1, l1 = _esmap2(bx, by, view_state)
-    p2, l2 = _esmap2(ex, ey, view_state)
-    view_state.segbuf.extend([p1, l1, p2, l2, color])
-    if len(view_state.segbuf) >= BSIZE:
-        n = len(view_state.segbuf)
-        segs = view_state.segbuf[:]
+    # Port of ESMAP2 (projection (x, y) to device pixel/line), inlined here for
+    # both endpoints with the mapping constants bound once.
+    pcen = view_state._pcen
+    lcen = view_state._lcen
+    ux = view_state._ux
+    uy = view_state._uy
+    xcen = view_state._xcen
+    ycen = view_state._ycen
+    segbuf = view_state.segbuf
+    segbuf.extend(
+        (
+            _nint(pcen + ux * (bx - xcen)),
+            _nint(lcen + uy * (by - ycen)),
+            _nint(pcen + ux * (ex - xcen)),
+            _nint(lcen + uy * (ey - ycen)),
+            color,
+        )
+    )
+    if len(segbuf) >= BSIZE:
+        # Hand the full buffer to esdr07 and start a new one instead of copying it.
         view_state.segbuf = []
-        esdr07(n, segs, escher_state)
+        esdr07(len(segbuf), segbuf, escher_state)
 
 
 def esdump(view_state: EscherViewState, escher_state: EscherState) -> None:
@@ -306,10 +305,9 @@ def esdump(view_state: EscherViewState, escher_state: EscherState) -> None:
     """
     if not view_state.segbuf:
         return
-    n = len(view_state.segbuf)
-    segs = view_state.segbuf[:]
+    segs = view_state.segbuf
     view_state.segbuf = []
-    esdr07(n, segs, escher_state)
+    esdr07(len(segs), segs, escher_state)
 
 
 def esclr(
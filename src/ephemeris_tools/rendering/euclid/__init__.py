@@ -23,8 +23,9 @@ points:
   - euclr    Advance the film (clear the drawing region).
   - eubody   Shoot and develop one body at a time.
 
-Additional entry points eustar, euring, eutemp allow stars, rings, and
-temperature/illumination refinements in the image.
+Additional entry points eustar, euring, eutemp (and its single-segment form
+eutemp_segment) allow stars, rings, and temperature/illumination refinements
+in the image.
 
 Typical usage (single picture)::
 
@@ -39,23 +40,25 @@ This package produces segment arrays for the Escher layer (ESDRAW/ESDUMP) so
 that viewer PostScript matches FORTRAN byte-for-byte.
 """
 
-from ephemeris_tools.rendering.euclid.body import eubody
+from ephemeris_tools.rendering.euclid.body import eubody, eubody_visible
 from ephemeris_tools.rendering.euclid.clear import euclr
 from ephemeris_tools.rendering.euclid.constants import STARFONT_PLUS
 from ephemeris_tools.rendering.euclid.init_geom import eugeom, euinit, euview
 from ephemeris_tools.rendering.euclid.ring import euring
-from ephemeris_tools.rendering.euclid.star_temp import eustar, eutemp
+from ephemeris_tools.rendering.euclid.star_temp import eustar, eutemp, eutemp_segment
 from ephemeris_tools.rendering.euclid.state import EuclidState
 
 __all__: list[str] = [
     'STARFONT_PLUS',
     'EuclidState',
     'eubody',
+    'eubody_visible',
     'euclr',
     'eugeom',
     'euinit',
     'euring',
     'eustar',
     'eutemp',
+    'eutemp_segment',
     'euview',
 ]
@@ -34,6 +34,28 @@ from ephemeris_tools.rendering.euclid.vec_math import (
 )
 
 
+def eubody_visible(body: int, euclid_state: EuclidState) -> bool:
+    """Return True if a body's bounding disk can overlap the field of view.
+
+    This is the cheap pre-clip that EUBODY performs before any tessellation:
+    the body must exist, be in front of the camera, and have a limb disk that
+    overlaps the FOV circle. Callers that draw a body several times can test
+    once and skip every EUBODY call for bodies that would draw nothing.
+
+    Parameters:
+        body: Body index (1-based, from the last eugeom call).
+        euclid_state: Euclid state from eugeom/euview.
+
+    Returns:
+        False if EUBODY would draw nothing for this body, True otherwise.
+    """
+    st = euclid_state
+    bi = body - 1
+    if bi < 0 or bi >= st.nbody or not st.cansee[bi]:
+        return False
+    return _ovrlap(st.lcentr[bi], st.biga[bi], st.fovcen, st.fovrad) != 0
+
+
 def eubody(
     body: int,
     merids: int,
@@ -64,19 +86,11 @@ def eubody(
         view_state: Escher view state.
         escher_state: Escher output state.
     """
+    if not eubody_visible(body, euclid_state):
+        return
     st = euclid_state
     bi = body - 1  # 0-based index
 
-    if bi < 0 or bi >= st.nbody:
-        return
-    if not st.cansee[bi]:
-        return
-
-    # Check FOV overlap
-    intsec = _ovrlap(st.lcentr[bi], st.biga[bi], st.fovcen, st.fovrad)
-    if intsec == 0:
-        return
-
     # Find candidate occulting bodies
     occltd = False
     bodyd = _vnorm(st.centrs[bi])
@@ -105,3 +105,31 @@ def eutemp(
         end = (-xend[i], -yend[i], 1.0)
         esdraw(beg, end, color, view_state, escher_state)
     esdump(view_state, escher_state)
+
+
+def eutemp_segment(
+    xbegin: float,
+    ybegin: float,
+    xend: float,
+    yend: float,
+    color: int,
+    view_state: EscherViewState,
+    escher_state: EscherState,
+) -> None:
+    """Draw a single image-plane overlay segment (scalar form of EUTEMP).
+
+    Equivalent to ``eutemp([xbegin], [ybegin], [xend], [yend], 1, ...)`` but
+    takes the endpoints directly, so callers drawing one segment at a time
+    (tick marks, label pointers) do not build four one-element lists per call.
+
+    Parameters:
+        xbegin: x-coordinate of the segment start.
+        ybegin: y-coordinate of the segment start.
+        xend: x-coordinate of the segment end.
+        yend: y-coordinate of the segment end.
+        color: Color code for drawing.
+        view_state: Escher view state.
+        escher_state: Escher output state.
+    """
+    esdraw((-xbegin, -ybegin, 1.0), (-xend, -yend, 1.0), color, view_state, escher_state)
+    esdump(view_state, escher_state)
@@ -53,3 +53,52 @@ class EuclidState:
         self.vertex: list[list[Vec3]] = []
         self.ecaxis: list[list[Vec3]] = []
         self.canecl: list[list[bool]] = []  # canecl[body][lsrce]
+
+    def save_geometry(self) -> dict[str, object]:
+        """Return the scene geometry set by the last eugeom call.
+
+        eubody, euring, and eustar only read this geometry, and eugeom always
+        replaces it with new objects, so the snapshot holds references rather
+        than copies.
+
+        Returns:
+            Opaque snapshot for restore_geometry.
+        """
+        return {name: getattr(self, name) for name in _GEOMETRY_FIELDS}
+
+    def restore_geometry(self, snapshot: dict[str, object]) -> None:
+        """Reinstate geometry saved by save_geometry (same as repeating that eugeom call).
+
+        Parameters:
+            snapshot: Value returned by save_geometry.
+        """
+        for name, value in snapshot.items():
+            setattr(self, name, value)
+
+
+# EuclidState attributes assigned by eugeom.
+_GEOMETRY_FIELDS = (
+    'nlight',
+    'nbody',
+    'radii',
+    'lights',
+    'obsrvr',
+    'camera',
+    'centrs',
+    'prnpls',
+    'a',
+    'biga',
+    'smalla',
+    'lnorml',
+    'lmajor',
+    'lminor',
+    'lcentr',
+    'cansee',
+    'tnorml',
+    'tmajor',
+    'tminor',
+    'tcentr',
+    'vertex',
+    'ecaxis',
+    'canecl',
+)
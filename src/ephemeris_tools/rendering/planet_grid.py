@@ -10,6 +10,7 @@ if TYPE_CHECKING:
 
 from ephemeris_tools.constants import SUN_ID
 from ephemeris_tools.spice.bodmat import bodmat
+from ephemeris_tools.spice.body_constants import body_radii
 from ephemeris_tools.spice.common import get_state
 from ephemeris_tools.spice.observer import observer_state
 
@@ -137,8 +138,7 @@ def compute_planet_grid(
     else:
         rot = rot_raw
     rot_t = [list(col) for col in zip(rot[0], rot[1], rot[2], strict=True)]
-    radii = cspyce.bodvrd(str(planet_id), 'RADII')
-    a, b, c = float(radii[0]), float(radii[1]), float(radii[2])
+    a, b, c = body_radii(planet_id)
 
     obs_to_planet = (
         float(planet_dpv[0]),
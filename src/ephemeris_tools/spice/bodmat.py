@@ -40,6 +40,29 @@ def _body_fixed_frame(body_id: int) -> str:
     return f'IAU_{name.upper()}'
 
 
+# Successful TIPBOD results kept per (body, time); cleared when kernels change.
+_TIPBOD_CACHE_SIZE = 64
+
+
+def _tipbod(body_id: int, et: float) -> np.ndarray:
+    """Return cspyce.tipbod('J2000', body_id, et) as a new array, cached per (body, et).
+
+    Only successful lookups are cached (in SpiceState, cleared with the other
+    kernel-pool constants); errors propagate from cspyce.tipbod every time.
+    """
+    import numpy as np
+
+    cache = get_state().body_tipbod
+    key = (body_id, et)
+    mat = cache.get(key)
+    if mat is None:
+        mat = np.array(cspyce.tipbod('J2000', body_id, et), dtype=np.float64)
+        if len(cache) >= _TIPBOD_CACHE_SIZE:
+            cache.clear()
+        cache[key] = mat
+    return mat.copy()
+
+
 def bodmat(body_id: int, et: float) -> np.ndarray:
     """Return rotation matrix from J2000 to body-fixed frame (port of RSPK_BODMAT).
 
@@ -59,15 +82,13 @@ def bodmat(body_id: int, et: float) -> np.ndarray:
     for i in range(state.nshifts):
         if state.shift_id[i] == body_id:
             try:
-                rot = cspyce.tipbod('J2000', body_id, et + state.shift_dt[i])
-                return np.array(rot, dtype=np.float64)
+                return _tipbod(body_id, et + state.shift_dt[i])
             except Exception as e:
                 logger.debug('time-shifted tipbod failed: %s', e, exc_info=True)
             break
     mat: np.ndarray
     try:
-        rot = cspyce.tipbod('J2000', body_id, et)
-        mat = np.array(rot, dtype=np.float64)
+        mat = _tipbod(body_id, et)
     except Exception as e:
         msg = str(e)
         if _is_moon(body_id):
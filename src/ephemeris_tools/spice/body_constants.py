@@ -0,0 +1,48 @@
+"""Cached per-body constants from the SPICE kernel pool (RADII, POLE_RA)."""
+
+from __future__ import annotations
+
+import cspyce
+
+from ephemeris_tools.spice.common import get_state
+
+
+def body_radii(body_id: int) -> tuple[float, float, float]:
+    """Return the body's RADII from the kernel pool, cached per NAIF ID.
+
+    The cache lives in SpiceState and is cleared by load_spice_files and
+    load_spacecraft. Failed lookups are not cached.
+
+    Parameters:
+        body_id: SPICE body ID.
+
+    Returns:
+        Tri-axial radii (a, b, c) in km.
+
+    Raises:
+        Exception: Whatever cspyce.bodvar raises if RADII is not available.
+    """
+    cache = get_state().body_radii
+    radii = cache.get(body_id)
+    if radii is None:
+        a, b, c = (float(r) for r in cspyce.bodvar(body_id, 'RADII'))
+        radii = (a, b, c)
+        cache[body_id] = radii
+    return radii
+
+
+def has_pole_ra(body_id: int) -> bool:
+    """Return True if the kernel pool defines POLE_RA for the body (cached BODFND).
+
+    Parameters:
+        body_id: SPICE body ID.
+
+    Returns:
+        True if BODY<id>_POLE_RA is in the kernel pool.
+    """
+    cache = get_state().body_has_pole
+    found = cache.get(body_id)
+    if found is None:
+        found = bool(cspyce.bodfnd(body_id, 'POLE_RA'))
+        cache[body_id] = found
+    return found
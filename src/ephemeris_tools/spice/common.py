@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 MAXSHIFTS = 20
 
@@ -12,7 +16,8 @@ class SpiceState:
     """Shared state for SPICE/RSPK layer (replaces FORTRAN RSPK_COMMON).
 
     Holds current planet, observer (ID or geodetic), and time-shift list for
-    moon orbits. Modified by load_spice_files, set_observer_*, set_shift.
+    moon orbits, plus per-body constants read from the kernel pool (see
+    body_constants). Modified by load_spice_files, set_observer_*, set_shift.
     """
 
     planet_num: int = 0
@@ -26,6 +31,10 @@ class SpiceState:
     nshifts: int = 0
     shift_id: list[int] = field(default_factory=lambda: [0] * MAXSHIFTS)
     shift_dt: list[float] = field(default_factory=lambda: [0.0] * MAXSHIFTS)
+    body_radii: dict[int, tuple[float, float, float]] = field(default_factory=dict)
+    body_has_pole: dict[int, bool] = field(default_factory=dict)
+    body_tipbod: dict[tuple[int, float], np.ndarray] = field(default_factory=dict)
+    kernel_generation: int = 0
 
     def reset_shifts(self) -> None:
         """Clear all time shifts (no Fortran equivalent; utility)."""
@@ -33,6 +42,17 @@ class SpiceState:
         self.shift_id = [0] * MAXSHIFTS
         self.shift_dt = [0.0] * MAXSHIFTS
 
+    def clear_body_constants(self) -> None:
+        """Forget cached kernel-pool body constants (call whenever kernels change).
+
+        Also advances kernel_generation, which callers caching derived SPICE
+        results include in their cache keys.
+        """
+        self.body_radii.clear()
+        self.body_has_pole.clear()
+        self.body_tipbod.clear()
+        self.kernel_generation += 1
+
 
 # Module-level singleton (FORTRAN common block behavior)
 _state = SpiceState()
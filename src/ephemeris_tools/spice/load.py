@@ -34,6 +34,7 @@ def load_spice_files(
         (True, None) if loaded successfully; (False, error_message) on failure.
     """
     state = get_state()
+    state.clear_body_constants()
     if force:
         try:
             cspyce.kclear()
@@ -150,6 +151,7 @@ def load_spacecraft(
         True if kernels were loaded, False otherwise.
     """
     state = get_state()
+    state.clear_body_constants()
     if state.planet_num != 0 and state.planet_num != planet:
         return False
     base = Path(get_spice_path())
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import math
 import sys
 from typing import TextIO
 
@@ -19,10 +18,9 @@ from ephemeris_tools.constants import (
 )
 from ephemeris_tools.params import ViewerParams
 from ephemeris_tools.rendering.draw_view import (
-    FOV_PTS,
     DrawPlanetaryViewOptions,
+    Projector,
     draw_planetary_view,
-    radec_to_plot,
 )
 from ephemeris_tools.rendering.planet_grid import compute_planet_grid
 from ephemeris_tools.spice.geometry import (
@@ -267,26 +265,22 @@ def _run_viewer_impl(
         )
 
     # Plot: FOV_PTS diameter, scale = FOV_PTS / (2*tan(fov/2)) for camera projection.
-    scale = FOV_PTS / (2.0 * math.tan(fov_rad / 2.0))
-
-    def to_plot(ra: float, dec: float) -> tuple[float, float] | None:
-        """Convert (ra, dec) in radians to plot (x, y) via camera projection."""
-        return radec_to_plot(ra, dec, center_ra_rad, center_dec_rad, fov_rad)
-
+    projector = Projector(center_ra_rad, center_dec_rad, fov_rad)
+    scale = projector.scale
+
+    # Project the planet and all tracked moons in one batch; drop bodies behind the camera.
+    plot_ids = [cfg.planet_id, *track_moon_ids]
+    plot_radecs = [(planet_ra, planet_dec)] + [body_radec(et, mid) for mid in track_moon_ids]
+    xs, ys, visible = projector.project_arr(
+        [ra for ra, _ in plot_radecs], [dec for _, dec in plot_radecs]
+    )
     bodies: list[tuple[float, float, str, bool]] = []
-    plot_result = to_plot(planet_ra, planet_dec)
-    if plot_result is not None:
-        px, py = plot_result
-        bodies.append((px, py, cfg.planet_name, True))
-
-    for mid in track_moon_ids:
-        ra, dec = body_radec(et, mid)
-        plot_result = to_plot(ra, dec)
-        if plot_result is None:
+    for i, body_id in enumerate(plot_ids):
+        if not visible[i]:
             continue
-        mx, my = plot_result
-        name = id_to_name.get(mid, str(mid))
-        bodies.append((mx, my, name.upper(), False))
+        is_planet = i == 0
+        name = cfg.planet_name if is_planet else id_to_name.get(body_id, str(body_id)).upper()
+        bodies.append((float(xs[i]), float(ys[i]), name, is_planet))
 
     # Use CGI/CLI title directly; blank title remains blank.
     title = title or ''
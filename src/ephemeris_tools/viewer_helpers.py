@@ -103,8 +103,12 @@ _MOON_LABEL_LARGE_PTS = 12.0
 
 
 def _fortran_nint(value: float) -> int:
-    """Return FORTRAN-compatible nearest integer (ties away from zero)."""
-    return int(value + 0.5) if value >= 0.0 else int(value - 0.5)
+    """Return FORTRAN-compatible nearest integer (ties away from zero).
+
+    Adds 0.5 with the sign of value and truncates: the same sums as the
+    branching form, int(value + 0.5) or int(value - 0.5), without the branch.
+    """
+    return int(value + math.copysign(0.5, value))
 
 
 def _fortran_fixed(value: float, decimals: int) -> str:
@@ -0,0 +1,75 @@
+"""Tests for cached kernel-pool body constants."""
+
+from __future__ import annotations
+
+import pytest
+
+from ephemeris_tools.spice.body_constants import body_radii, has_pole_ra
+from ephemeris_tools.spice.common import get_state
+
+
+def test_body_constants_are_cached_until_cleared(monkeypatch: pytest.MonkeyPatch) -> None:
+    """RADII and POLE_RA are read once per body and re-read after clear_body_constants."""
+    calls: list[tuple[int, str]] = []
+
+    def _bodvar(body: int, item: str) -> list[float]:
+        calls.append((body, item))
+        return [float(body), 2.0, 3.0]
+
+    def _bodfnd(body: int, item: str) -> bool:
+        calls.append((body, item))
+        return body == 601
+
+    monkeypatch.setattr('cspyce.bodvar', _bodvar)
+    monkeypatch.setattr('cspyce.bodfnd', _bodfnd)
+    state = get_state()
+    monkeypatch.setattr(state, 'body_radii', {})
+    monkeypatch.setattr(state, 'body_has_pole', {})
+
+    assert body_radii(601) == (601.0, 2.0, 3.0)
+    assert body_radii(601) == (601.0, 2.0, 3.0)
+    assert has_pole_ra(601)
+    assert not has_pole_ra(602)
+    assert not has_pole_ra(602)
+    assert calls == [(601, 'RADII'), (601, 'POLE_RA'), (602, 'POLE_RA')]
+
+    state.clear_body_constants()
+    assert body_radii(601) == (601.0, 2.0, 3.0)
+    assert len(calls) == 4
+
+
+def test_body_radii_does_not_cache_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A failed RADII lookup raises and is retried on the next call."""
+
+    def _bodvar(body: int, item: str) -> list[float]:
+        raise RuntimeError('no radii')
+
+    monkeypatch.setattr('cspyce.bodvar', _bodvar)
+    monkeypatch.setattr(get_state(), 'body_radii', {})
+    with pytest.raises(RuntimeError):
+        body_radii(616)
+    assert 616 not in get_state().body_radii
+
+
+def test_bodmat_caches_tipbod_per_body_and_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    """bodmat reads TIPBOD once per (body, et) and returns independent copies."""
+    from ephemeris_tools.spice.bodmat import bodmat
+
+    calls: list[tuple[int, float]] = []
+
+    def _tipbod(frame: str, body: int, et: float) -> list[list[float]]:
+        calls.append((body, et))
+        return [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, float(body)]]
+
+    monkeypatch.setattr('cspyce.tipbod', _tipbod)
+    state = get_state()
+    monkeypatch.setattr(state, 'body_tipbod', {})
+    monkeypatch.setattr(state, 'nshifts', 0)
+
+    first = bodmat(699, 10.0)
+    first[0][0] = -5.0
+    second = bodmat(699, 10.0)
+    assert second[0][0] == 1.0
+    assert second[2][2] == 699.0
+    bodmat(699, 11.0)
+    assert calls == [(699, 10.0), (699, 11.0)]
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import math
+import time
 from io import StringIO
 
 import pytest
 
 from ephemeris_tools.rendering.draw_view import (
+    FOV_PTS,
     DrawPlanetaryViewOptions,
+    Projector,
     _rspk_write_label,
+    camera_matrix,
     draw_planetary_view,
+    radec_to_plot,
+    radec_to_plot_many,
 )
 from ephemeris_tools.rendering.escher import EscherState
 
@@ -94,3 +101,444 @@ def test_rspk_write_label_left_keeps_millisecond_precision() -> None:
     _rspk_write_label(-(21 * 3600 + 58 * 60 + 49.001), 'L', state)
     s = out.getvalue()
     assert '(-21 58 49.001) LabelLeft' in s
+
+
+def test_projector_matches_spice_reference() -> None:
+    """Projector.project agrees with the SPICE RADREC/MTXV projection it replaced."""
+    import cspyce
+
+    center_ra, center_dec, fov = 1.2, -0.3, 0.01
+    col3 = list(cspyce.radrec(1.0, center_ra, center_dec))
+    col2 = list(cspyce.vhat(cspyce.vperp((0.0, 0.0, 1.0), col3)))
+    col1 = list(cspyce.vcrss(col2, col3))
+    cmat = [[col1[i], col2[i], col3[i]] for i in range(3)]
+    scale = FOV_PTS / (2.0 * math.tan(fov / 2.0))
+
+    projector = Projector(center_ra, center_dec, fov)
+    assert projector.scale == pytest.approx(scale)
+    assert projector.project(center_ra, center_dec) == pytest.approx((0.0, 0.0), abs=1e-9)
+    for ra, dec in [(1.2 + 0.003, -0.3), (1.2, -0.3 + 0.002), (1.2 - 0.001, -0.3 - 0.004)]:
+        cam = list(cspyce.mtxv(cmat, cspyce.radrec(1.0, ra, dec)))
+        expected = (-scale * cam[0] / cam[2], -scale * cam[1] / cam[2])
+        xy = projector.project(ra, dec)
+        assert xy is not None
+        assert xy == pytest.approx(expected, rel=1e-12, abs=1e-9)
+    assert projector.project(center_ra + math.pi, -center_dec) is None
+
+
+def test_projector_rejects_nonpositive_fov() -> None:
+    """Projector raises ValueError for a non-positive field of view."""
+    with pytest.raises(ValueError, match='fov_rad must be positive'):
+        Projector(0.0, 0.0, 0.0)
+
+
+def test_projector_project_arr_matches_scalar_path() -> None:
+    """Batched projection agrees with project() and masks out behind-camera points."""
+    projector = Projector(0.5, 0.2, 0.02)
+    ras = [0.5, 0.505, 0.49, 0.5 + math.pi]
+    decs = [0.2, 0.195, 0.21, -0.2]
+    xs, ys, visible = projector.project_arr(ras, decs)
+    assert visible.tolist() == [True, True, True, False]
+    for ra, dec, x, y in zip(ras[:3], decs[:3], xs[:3], ys[:3], strict=True):
+        assert (x, y) == pytest.approx(projector.project(ra, dec))
+    assert math.isnan(xs[3])
+    assert math.isnan(ys[3])
+
+
+def test_projector_rejects_fov_at_or_above_pi() -> None:
+    """tan(fov/2) is undefined at pi, so Projector rejects such fields of view."""
+    with pytest.raises(ValueError, match='less than pi'):
+        Projector(0.0, 0.0, math.pi)
+
+
+def test_pad_copies_mutable_defaults() -> None:
+    """Padded entries are independent copies of a mutable default."""
+    from ephemeris_tools.rendering.draw_view_impl import _pad
+
+    default = [0.0, 0.0, 0.0]
+    offsets = [[1.0, 2.0, 3.0]]
+    _pad(offsets, 3, default)
+    assert offsets == [[1.0, 2.0, 3.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+    offsets[1][0] = 5.0
+    assert offsets[2] == [0.0, 0.0, 0.0]
+    assert default == [0.0, 0.0, 0.0]
+    _pad(offsets, 2, default)
+    assert len(offsets) == 3
+
+
+def test_esdr07_writes_all_paths_in_one_call() -> None:
+    """ESDR07 output for a whole segment buffer reaches the stream as one write."""
+    from ephemeris_tools.rendering.escher import esdr07
+
+    writes: list[str] = []
+
+    class _Recorder(StringIO):
+        def write(self, s: str) -> int:
+            writes.append(s)
+            return super().write(s)
+
+    state = EscherState()
+    state.outuni = _Recorder()
+    # Two connected black segments, then a zero-length white one.
+    segs = [10, 20, 30, 40, 1, 30, 40, 50, 60, 1, 100, 100, 100, 100, 0]
+    esdr07(len(segs), segs, state)
+    assert writes == ['N\n10 20 M\n30 40 L\n50 60 L\n0.0 G\nS\nN\n100 100 M\n101 100 L\n1.0 G\nS\n']
+    assert (state.xsave, state.ysave, state.oldcol) == (101, 100, 0)
+
+
+def test_radec_to_plot_many_matches_scalar_calls() -> None:
+    """The batch API agrees with radec_to_plot for every point."""
+    ras = [2.0, 2.001, 1.998]
+    decs = [0.4, 0.399, 0.402]
+    xs, ys, visible = radec_to_plot_many(ras, decs, 2.0, 0.4, 0.05)
+    assert visible.all()
+    for ra, dec, x, y in zip(ras, decs, xs, ys, strict=True):
+        assert (x, y) == pytest.approx(radec_to_plot(ra, dec, 2.0, 0.4, 0.05))
+
+
+def test_rspk_escape_handles_all_special_characters() -> None:
+    """Backslashes, parentheses, and the degree sign are escaped in one pass."""
+    from ephemeris_tools.rendering.draw_view_helpers import _rspk_escape
+
+    assert _rspk_escape('plain text') == 'plain text'
+    assert _rspk_escape('a\\b (c) 10\u00b0') == 'a\\\\b \\(c\\) 10\\260'
+
+
+def test_camera_matrix_matches_spice_routines() -> None:
+    """Inline camera_matrix reproduces the cspyce RADREC/VPERP/VHAT/VCRSS chain exactly."""
+    import cspyce
+
+    for ra, dec in [(0.0, 0.0), (1.234, 0.567), (-3.67, 0.139), (4.71, -1.3649), (2.0, 1.5707)]:
+        col3 = list(cspyce.radrec(1.0, ra, dec))
+        col2 = list(cspyce.vhat(cspyce.vperp((0.0, 0.0, 1.0), col3)))
+        col1 = list(cspyce.vcrss(col2, col3))
+        expected = [[col1[i], col2[i], col3[i]] for i in range(3)]
+        assert camera_matrix(ra, dec) == expected
+
+
+def test_tick_choice_matches_fortran_scan() -> None:
+    """Bisection picks the same tick-step index as the FORTRAN downward scan."""
+    from ephemeris_tools.rendering import draw_view_helpers as helpers
+
+    def fortran_scan(sdelta: float) -> int:
+        i = helpers._NCHOICES
+        while i >= 2:
+            if 2.0 * sdelta >= helpers._MINSTEPS * helpers._STEP1_F32[i]:
+                break
+            i -= 1
+        return i
+
+    spans = [0.0, 1e-4, 0.0015, 0.003, 7.5, 44.0, 5400.0, 1e6]
+    spans += [span / 2.0 for span in helpers._STEP1_MIN_SPAN]
+    for sdelta in spans:
+        assert helpers._tick_choice(sdelta) == fortran_scan(sdelta)
+
+
+def test_generated_date_str_is_cached_per_second(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The footer date is formatted once per second and refreshed when the second changes."""
+    from ephemeris_tools.rendering import draw_view_helpers as helpers
+
+    calls: list[float | None] = []
+    real_localtime = time.localtime
+
+    def counting_localtime(secs: float | None = None) -> object:
+        calls.append(secs)
+        return real_localtime(secs)
+
+    monkeypatch.setattr(helpers, '_generated_date_cache', (-1, ''))
+    monkeypatch.setattr(time, 'time', lambda: 1_700_000_000.25)
+    monkeypatch.setattr(time, 'localtime', counting_localtime)
+    first = helpers._generated_date_str()
+    assert helpers._generated_date_str() == first
+    assert len(calls) == 1
+    monkeypatch.setattr(time, 'time', lambda: 1_700_000_001.0)
+    assert helpers._generated_date_str() != first
+    assert len(calls) == 2
+
+
+def test_radrec_many_matches_radrec() -> None:
+    """Batched unit vectors equal the scalar _radrec(1.0, lon, lat) results exactly."""
+    from ephemeris_tools.rendering.draw_view_helpers import _radrec, _radrec_many
+
+    lons = [0.0, 0.3, math.pi / 2.0, 3.0, 5.9, -1.2]
+    lats = [0.0, -0.4, 0.1, math.pi / 2.0, -1.5, 0.77]
+    rows = _radrec_many(lons, lats)
+    assert rows == [list(_radrec(1.0, lon, lat)) for lon, lat in zip(lons, lats, strict=True)]
+    assert _radrec_many([], []) == []
+
+
+def test_arc_loops_match_stepwise_loop() -> None:
+    """Batched arc loops equal the step-by-step FORTRAN loop construction."""
+    from ephemeris_tools.rendering.draw_view_helpers import LOOP_WIDTH, _arc_loops, _vhat
+
+    ax1 = [120000.0, -3000.0, 250.0]
+    ax2 = [2500.0, 119000.0, -80.0]
+    loc = [1.0e9, -2.0e8, 3.0e7]
+    lon1, dlon, nsteps = 0.2, 0.3 / 30, 30
+    axes1, axes2, locs = _arc_loops(lon1, dlon, nsteps, ax1, ax2, loc)
+    assert len(axes1) == len(axes2) == len(locs) == nsteps
+    lon = lon1 - dlon
+    for k in range(nsteps):
+        lon += dlon
+        vec1 = [math.cos(lon) * ax1[i] + math.sin(lon) * ax2[i] for i in range(3)]
+        vec2 = [math.cos(lon + dlon) * ax1[i] + math.sin(lon + dlon) * ax2[i] for i in range(3)]
+        tmid = [0.5 * vec1[i] + 0.5 * vec2[i] for i in range(3)]
+        assert axes1[k] == [vec1[i] - tmid[i] for i in range(3)]
+        assert axes2[k] == [LOOP_WIDTH * c for c in _vhat(tmid)]
+        assert locs[k] == [tmid[i] + loc[i] for i in range(3)]
+
+
+def test_planet_frame_is_cached_until_kernels_change(monkeypatch: pytest.MonkeyPatch) -> None:
+    """_planet_frame reuses its result until the kernel generation advances."""
+    import numpy as np
+
+    from ephemeris_tools.rendering import draw_view_impl as impl
+    from ephemeris_tools.spice import bodmat as bodmat_mod
+    from ephemeris_tools.spice import observer as observer_mod
+    from ephemeris_tools.spice.common import get_state
+
+    calls: list[int] = []
+
+    def fake_spkapp(target, et, ref, obs, abcorr):  # type: ignore[no-untyped-def]
+        calls.append(target)
+        return np.arange(6.0) + target, 1.0
+
+    monkeypatch.setattr('cspyce.spkapp', fake_spkapp)
+    monkeypatch.setattr('cspyce.spkssb', lambda target, et, ref: np.zeros(6))
+    monkeypatch.setattr(bodmat_mod, 'bodmat', lambda body, et: np.eye(3))
+    monkeypatch.setattr(observer_mod, 'observer_state', lambda et: np.ones(6))
+    impl._planet_frame_cached.cache_clear()
+
+    first = impl._planet_frame(699, 1.0e8)
+    again = impl._planet_frame(699, 1.0e8)
+    assert again is first
+    assert len(calls) == 2
+    assert first.planet_dpv == (699.0, 700.0, 701.0, 702.0, 703.0, 704.0)
+    assert first.planet_mat == ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+
+    get_state().clear_body_constants()
+    assert impl._planet_frame(699, 1.0e8) is not first
+    assert len(calls) == 4
+    impl._planet_frame_cached.cache_clear()
+
+
+def test_planet_frame_recomputes_when_observer_or_shifts_change(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Changing the observer or a time shift is a _planet_frame cache miss."""
+    import numpy as np
+
+    from ephemeris_tools.rendering import draw_view_impl as impl
+    from ephemeris_tools.spice import bodmat as bodmat_mod
+    from ephemeris_tools.spice import observer as observer_mod
+    from ephemeris_tools.spice.common import get_state
+    from ephemeris_tools.spice.observer import set_observer_id, set_observer_location
+    from ephemeris_tools.spice.shifts import set_shift
+
+    calls: list[int] = []
+
+    def fake_spkapp(target, et, ref, obs, abcorr):  # type: ignore[no-untyped-def]
+        calls.append(target)
+        return np.zeros(6), 1.0
+
+    monkeypatch.setattr('cspyce.spkapp', fake_spkapp)
+    monkeypatch.setattr('cspyce.spkssb', lambda target, et, ref: np.zeros(6))
+    monkeypatch.setattr(bodmat_mod, 'bodmat', lambda body, et: np.eye(3))
+    monkeypatch.setattr(observer_mod, 'observer_state', lambda et: np.ones(6))
+    # Restore the observer and shift settings changed below.
+    st = get_state()
+    for name in ('obs_id', 'obs_is_set', 'obs_lat', 'obs_lon', 'obs_alt', 'nshifts'):
+        monkeypatch.setattr(st, name, getattr(st, name))
+    monkeypatch.setattr(st, 'shift_id', list(st.shift_id))
+    monkeypatch.setattr(st, 'shift_dt', list(st.shift_dt))
+    impl._planet_frame_cached.cache_clear()
+
+    impl._planet_frame(699, 1.0e8)
+    impl._planet_frame(699, 1.0e8)
+    assert len(calls) == 2
+
+    set_observer_id(-82)
+    impl._planet_frame(699, 1.0e8)
+    assert len(calls) == 4
+
+    set_observer_location(19.8, -155.5, 4200.0)
+    impl._planet_frame(699, 1.0e8)
+    assert len(calls) == 6
+
+    set_shift(601, 10.0)
+    impl._planet_frame(699, 1.0e8)
+    assert len(calls) == 8
+
+    set_shift(601, 20.0)
+    impl._planet_frame(699, 1.0e8)
+    impl._planet_frame(699, 1.0e8)
+    assert len(calls) == 10
+    impl._planet_frame_cached.cache_clear()
+
+
+def test_labels2_ticks_match_scalar_spice(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Batched tick offsets equal per-tick cspyce RADREC/MTXV projections exactly."""
+    import cspyce
+
+    from ephemeris_tools.rendering import draw_view_helpers as helpers
+
+    segments: list[tuple[float, float, float, float]] = []
+
+    def record(x0, y0, x1, y1, *args):  # type: ignore[no-untyped-def]
+        segments.append((x0, y0, x1, y1))
+
+    monkeypatch.setattr(helpers, 'eutemp_segment', record)
+    monkeypatch.setattr(helpers, '_rspk_write_label', lambda *args: None)
+    for ra, dec, delta in [(1.234, 0.567, 0.01), (4.71, -1.2, 0.003), (0.2, 0.05, 0.2)]:
+        cmat = camera_matrix(ra, dec)
+        segments.clear()
+        helpers._rspk_labels2(cmat, delta, 1, None, None)  # type: ignore[arg-type]
+
+        expected: list[float] = []
+        _rng, cra, cdec = cspyce.recrad((cmat[0][2], cmat[1][2], cmat[2][2]))
+        for spr, sdelta, center, is_ra in [
+            (helpers._SPR_RA, delta / math.cos(cdec) * helpers._SPR_RA, cra, True),
+            (helpers._SPR_DEC, delta * helpers._SPR_DEC, cdec, False),
+        ]:
+            i = helpers._tick_choice(sdelta)
+            ds = helpers._STEP1_F32[i] / helpers._SUBSTEPS[i]
+            k1 = helpers._fortran_nint((center * spr - sdelta) / ds + 0.5)
+            k2 = helpers._fortran_nint((center * spr + sdelta) / ds - 0.5)
+            for k in range(k1, k2 + 1):
+                angle = k * ds / spr
+                los = cspyce.radrec(1.0, angle, cdec) if is_ra else cspyce.radrec(1.0, cra, angle)
+                cam = cspyce.mtxv(cmat, los)
+                if cam[2] <= 1e-12:
+                    continue
+                off = -(cam[0] if is_ra else cam[1]) / cam[2]
+                if abs(off) <= delta:
+                    expected.extend([off, off])
+        # RA ticks are vertical (x0 == x1) and come first; Dec ticks follow.
+        nra = sum(1 for seg in segments if seg[0] == seg[2])
+        got = [seg[0] for seg in segments[:nra]] + [seg[1] for seg in segments[nra:]]
+        assert expected
+        assert got == expected
+
+
+def test_recrad_matches_spice() -> None:
+    """_recrad reproduces cspyce.recrad exactly, including axis and zero vectors."""
+    import cspyce
+
+    from ephemeris_tools.rendering.draw_view_helpers import _recrad
+
+    vectors = [(0.0, 0.0, 0.0), (0.0, 0.0, -2.0), (-1.0, -0.0, 0.0), (3e-200, -4e-200, 1e-200)]
+    vectors += [(0.3, -0.7, 0.2), (-5.0e9, 1.0, -3.0)]
+    for ra, dec in [(1.234, 0.567), (4.71, -1.2), (-0.3, 1.5707)]:
+        cmat = camera_matrix(ra, dec)
+        vectors.append((cmat[0][2], cmat[1][2], cmat[2][2]))
+    for v in vectors:
+        assert _recrad(v) == tuple(cspyce.recrad(v))
+
+
+def test_fortran_nint_rounds_ties_away_from_zero() -> None:
+    """_fortran_nint matches the FORTRAN NINT tie and sign rules."""
+    from ephemeris_tools.rendering.draw_view_helpers import _fortran_nint
+
+    cases = [(0.0, 0), (-0.0, 0), (0.5, 1), (-0.5, -1), (2.5, 3), (-2.5, -3)]
+    cases += [(1.4999, 1), (-1.4999, -1), (1e15 + 0.5, 1_000_000_000_000_001)]
+    for value, expected in cases:
+        assert _fortran_nint(value) == expected
+
+
+def test_rspk_annotate_matches_spice_projection(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Inlined camera projection places labels exactly where MTXV puts them."""
+    import cspyce
+
+    from ephemeris_tools.rendering import draw_view_helpers as helpers
+
+    points: list[tuple[float, float]] = []
+    labels: list[str] = []
+    monkeypatch.setattr(helpers, 'eutemp_segment', lambda x, y, *args: points.append((x, y)))
+    monkeypatch.setattr(helpers, 'esmove', lambda state: None)
+    monkeypatch.setattr(helpers, 'eswrit', lambda text, state: labels.append(text))
+
+    cmat = camera_matrix(1.1, -0.4)
+    delta, radius = 0.05, 0.003
+    optic = (cmat[0][2], cmat[1][2], cmat[2][2])
+    nshown = 0
+    for los in [optic, (0.2, 0.8, -0.4), (-0.2, -0.8, 0.4), (0.42, 0.82, -0.37), (0.0, 0.0, 1.0)]:
+        points.clear()
+        labels.clear()
+        helpers._rspk_annotate('Io (I)', los, radius, cmat, delta, None, None)  # type: ignore[arg-type]
+        cam = cspyce.mtxv(cmat, los)
+        x = -cam[0] / cam[2] + 0.7070 * radius
+        y = -cam[1] / cam[2] - 0.7070 * radius
+        if cam[2] > 0.0 and abs(x) < delta and abs(y) < delta:
+            assert points == [(x, y)]
+            assert labels == ['(Io \\(I\\)) LabelBody']
+            nshown += 1
+        else:
+            assert points == []
+            assert labels == []
+    assert nshown == 2
+
+
+def test_ring_shapes_match_scalar_chain() -> None:
+    """Batched ring geometry equals the per-ring VROTV/VHAT chain exactly."""
+    import random
+
+    from ephemeris_tools.rendering import draw_view_helpers as helpers
+
+    rng = random.Random(7)
+    pole = helpers._vhat([rng.uniform(-1, 1) for _ in range(3)])
+    ascnode = [-pole[1], pole[0], 0.0]
+    pole_axis = helpers._rotation_axis(pole)
+    planet_loc = [rng.uniform(-1e9, 1e9) for _ in range(3)]
+    obs_loc = [rng.uniform(-1e9, 1e9) for _ in range(3)]
+    offset = [rng.uniform(-10, 10) for _ in range(3)]
+    sun_hat = helpers._vhat([rng.uniform(-1, 1) for _ in range(3)])
+    sun_angular = 1e-3
+    n = 40
+    nodes: list[float] = [rng.uniform(-7, 7) for _ in range(n)]
+    incs: list[float] = [rng.choice([0.0, rng.uniform(-0.1, 0.1)]) for _ in range(n)]
+    peris: list[float] = [rng.uniform(-7, 7) for _ in range(n)]
+    rads: list[float] = [rng.uniform(1e4, 1e6) for _ in range(n)]
+    eccs: list[float] = [rng.choice([0.0, rng.uniform(0, 0.1)]) for _ in range(n)]
+    elevs: list[float] = [rng.choice([0.0, rng.uniform(-50, 50)]) for _ in range(n)]
+    offsets: list[list[float]] = [[rng.uniform(-5, 5) for _ in range(3)] for _ in range(n)]
+    dashed: list[bool] = [rng.random() < 0.2 for _ in range(n)]
+    got = helpers._ring_shapes(
+        pole=pole,
+        pole_axis=pole_axis,
+        ascnode=ascnode,
+        planet_loc=planet_loc,
+        obs_loc=obs_loc,
+        offset=offset,
+        sun_hat=sun_hat,
+        sun_angular=sun_angular,
+        nodes=nodes,
+        incs=incs,
+        peris=peris,
+        rads=rads,
+        eccs=eccs,
+        elevs=elevs,
+        offsets=offsets,
+        dashed=dashed,
+    )
+
+    for i in range(n):
+        rn, ri, rp = nodes[i], incs[i], peris[i]
+        rad, ecc, re = rads[i], eccs[i], elevs[i]
+        ringnode = helpers._vrotv_unit(ascnode, pole_axis, rn)
+        ringpole = helpers._vhat(helpers._vrotv(pole, ringnode, ri))
+        ringpole_axis = helpers._rotation_axis(ringpole)
+        peri = helpers._vhat(helpers._vrotv_unit(ringnode, ringpole_axis, rp - rn))
+        ax1 = [rad * peri[k] for k in range(3)]
+        minor = helpers._vrotv_unit(peri, ringpole_axis, helpers.HALFPI)
+        ax2 = [rad * math.sqrt(1.0 - ecc * ecc) * minor[k] for k in range(3)]
+        ro = offsets[i]
+        loc = [-ecc * ax1[k] + planet_loc[k] + re * pole[k] + ro[k] for k in range(3)]
+        tv = [loc[k] - obs_loc[k] + offset[k] for k in range(3)]
+        dot1 = -(ringpole[0] * tv[0] + ringpole[1] * tv[1] + ringpole[2] * tv[2])
+        dot2 = ringpole[0] * sun_hat[0] + ringpole[1] * sun_hat[1] + ringpole[2] * sun_hat[2]
+        dark = not dashed[i] and helpers._opsgnd(dot1, dot2) and abs(dot2) > sun_angular
+        assert got[0][i] == loc
+        assert got[1][i] == ax1
+        assert got[2][i] == ax2
+        assert got[3][i] == [helpers.RING_THICKNESS * ringpole[k] for k in range(3)]
+        assert got[4][i] == dark